@@ -8,7 +8,8 @@ Key Features:
 - Dynamic account loading from JSON configuration files
 - Account configuration validation and sanitization  
 - Credential management with security checks
-- Caching with automatic reload on file changes
+- Caching with automatic reload on file changes (inotify via watchdog when
+  available, periodic mtime scan otherwise)
 - Thread-safe singleton pattern for global access
 
 Architecture:
@@ -44,28 +45,97 @@ Usage:
     is_valid = validate_account_config(account_dict)
 """
 
-import json
+import contextlib
+import functools
+import logging
 import os
+import re
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import structlog
 from dotenv import load_dotenv
 
 from app.exceptions import ConfigurationError
 
-# Load environment variables from .env file
-load_dotenv(".env")
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps_indented(value) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    # Pure-Python fallback; json.loads decodes UTF-8 bytes itself
+    import json
+
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps_indented(value) -> bytes:
+        return json.dumps(value, indent=2, ensure_ascii=False).encode()
+
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; fall back to mtime polling
+    FileSystemEventHandler = object
+    Observer = None
 
 logger = structlog.get_logger(__name__)
 
+# The stdlib logger behind ``logger``; checking its level up front skips
+# building structlog event dicts for debug records that would be dropped
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Return whether debug records from this module would be emitted."""
+    return _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_env_loaded():
+    """Load environment variables from .env, once per process.
+
+    Called by the code paths that read credentials from the environment
+    rather than at import time.
+    """
+    load_dotenv(".env")
+
+
+# Account config validation constants
+_REQUIRED_FIELDS = (
+    "account_id",
+    "display_name",
+    "persona",
+    "exemplars",
+    "vector_collection",
+    "twitter_credentials",
+)
+_REQUIRED_CREDS = (
+    "api_key",
+    "api_secret",
+    "access_token",
+    "access_token_secret",
+    "bearer_token",
+)
+_PLACEHOLDER_PREFIX = "REPLACE_WITH_ACTUAL_"
+_ACCOUNT_ID_MATCH = re.compile(r"[A-Za-z0-9_-]+").fullmatch
+
 
 def resolve_env_variables(value: any) -> any:
     """Resolve environment variables in configuration values.
     
-    Recursively processes dictionaries and lists, replacing strings that start with 'env:'
-    with their corresponding environment variable values.
+    Walks dictionaries and lists, replacing strings that start with 'env:'
+    with their corresponding environment variable values. Only the containers
+    leading to an 'env:' string are copied; everything else is shared with
+    ``value``.
     
     Args:
         value: The configuration value to process
@@ -76,48 +146,451 @@ def resolve_env_variables(value: any) -> any:
     Raises:
         ConfigurationError: If an environment variable is not found
     """
-    if isinstance(value, str) and value.startswith('env:'):
-        env_var = value[4:]  # Remove 'env:' prefix
+    env_paths = _find_env_paths(value)
+    if not env_paths:
+        return value
+
+    ensure_env_loaded()
+    if type(value) is str:
+        env_var = env_paths[0][1]
         env_value = os.getenv(env_var)
         if env_value is None:
             raise ConfigurationError(f"Environment variable '{env_var}' not found")
         return env_value
-    elif isinstance(value, dict):
-        return {k: resolve_env_variables(v) for k, v in value.items()}
-    elif isinstance(value, list):
-        return [resolve_env_variables(item) for item in value]
-    else:
-        return value
+
+    return _apply_env_paths(value, env_paths)
+
+
+def _find_env_paths(value: any, path: Tuple = ()) -> List[Tuple[Tuple, str]]:
+    """Find every 'env:' string in a configuration.
+
+    Returns a list of ``(path, env_var)`` pairs where ``path`` is the tuple of
+    dict keys / list indexes leading to the value. The walk uses an explicit
+    stack and exact type checks, since parsed JSON only holds plain dicts,
+    lists and strs.
+    """
+    found = []
+    stack = [(path, value)]
+    while stack:
+        path, value = stack.pop()
+        value_type = type(value)
+        if value_type is str:
+            if value.startswith("env:"):
+                found.append((path, value[4:]))
+        elif value_type is dict:
+            stack.extend((path + (key,), item) for key, item in value.items())
+        elif value_type is list:
+            stack.extend((path + (index,), item) for index, item in enumerate(value))
+    return found
+
+
+def _apply_env_paths(config: Dict, env_paths: List[Tuple[Tuple, str]]) -> Dict:
+    """Return a copy of ``config`` with the given env paths resolved.
+
+    Only the containers on the way to an env reference are copied; every
+    other value is shared with ``config``.
+
+    Raises:
+        ConfigurationError: If an environment variable is not found
+    """
+    ensure_env_loaded()
+    resolved = config.copy()
+    copied = {(): resolved}
+
+    for path, env_var in env_paths:
+        env_value = os.getenv(env_var)
+        if env_value is None:
+            raise ConfigurationError(f"Environment variable '{env_var}' not found")
+
+        container = resolved
+        for depth in range(1, len(path)):
+            child = copied.get(path[:depth])
+            if child is None:
+                child = container[path[depth - 1]].copy()
+                container[path[depth - 1]] = child
+                copied[path[:depth]] = child
+            container = child
+        container[path[-1]] = env_value
+
+    return resolved
+
+
+def _resolve_config(
+    config: Dict, env_paths: List[Tuple[Tuple, str]]
+) -> Union[Dict, ConfigurationError]:
+    """Resolve a config's env paths, returning the error instead of raising it."""
+    if not env_paths:
+        # Pure-literal configs need no resolution
+        return config
+    try:
+        return _apply_env_paths(config, env_paths)
+    except ConfigurationError as e:
+        return e
+
+
+def _validate_and_find_env_paths(config: Dict) -> List[Tuple[Tuple, str]]:
+    """Validate an account configuration and collect its 'env:' references.
+
+    Both are done in one walk over the config. Returns the same
+    ``(path, env_var)`` pairs as ``_find_env_paths``.
+
+    Raises:
+        ConfigurationError: If the configuration is invalid
+    """
+    if not isinstance(config, dict):
+        raise ConfigurationError("account config must be a JSON object")
+
+    # Check required top-level fields, reporting every missing one at once
+    missing = [field for field in _REQUIRED_FIELDS if field not in config]
+    if missing:
+        raise ConfigurationError(
+            f"Missing required field in account config: {', '.join(missing)}"
+        )
+
+    # Validate account_id format
+    account_id = config["account_id"]
+    if not account_id or not isinstance(account_id, str):
+        raise ConfigurationError("account_id must be a non-empty string")
+
+    if not _ACCOUNT_ID_MATCH(account_id):
+        raise ConfigurationError(
+            "account_id must contain only alphanumeric characters, hyphens, and underscores"
+        )
+
+    # Validate twitter_credentials
+    twitter_creds = config["twitter_credentials"]
+    missing = [cred for cred in _REQUIRED_CREDS if cred not in twitter_creds]
+    if missing:
+        raise ConfigurationError(f"Missing Twitter credential: {', '.join(missing)}")
+
+    for cred in _REQUIRED_CREDS:
+        # Check if credentials are placeholder values
+        if twitter_creds[cred].startswith(_PLACEHOLDER_PREFIX):
+            logger.warning(
+                "Twitter credentials contain placeholder values",
+                account_id=account_id,
+                credential=cred,
+            )
+
+    # Validate exemplars structure
+    exemplars = config["exemplars"]
+    if not isinstance(exemplars, list):
+        raise ConfigurationError("exemplars must be a list")
+
+    # Exemplar lists can be long, so their env references are collected in the
+    # same walk that validates them
+    env_paths = []
+    for i, exemplar in enumerate(exemplars):
+        if not isinstance(exemplar, dict):
+            raise ConfigurationError(f"exemplar {i} must be a dictionary")
+
+        if "text" not in exemplar:
+            raise ConfigurationError(f"exemplar {i} missing required 'text' field")
+
+        env_paths.extend(_find_env_paths(exemplar, ("exemplars", i)))
+
+    # Validate persona
+    if not isinstance(config["persona"], str) or not config["persona"].strip():
+        raise ConfigurationError("persona must be a non-empty string")
+
+    # Validate vector_collection
+    if (
+        not isinstance(config["vector_collection"], str)
+        or not config["vector_collection"].strip()
+    ):
+        raise ConfigurationError("vector_collection must be a non-empty string")
+
+    for key, value in config.items():
+        if key != "exemplars":
+            env_paths.extend(_find_env_paths(value, (key,)))
+
+    if _debug_enabled():
+        logger.debug(
+            "Account configuration validated successfully", account_id=account_id
+        )
+    return env_paths
+
+
+def _parse_and_validate(raw: bytes) -> Tuple[Dict, List[Tuple[Tuple, str]]]:
+    """Parse an account file's bytes into a validated config and its env paths."""
+    config = _json_loads(raw)
+    return config, _validate_and_find_env_paths(config)
+
+
+class _AccountsDirEventHandler(FileSystemEventHandler):
+    """Mark the owning AccountManager dirty when an account file changes."""
+
+    def __init__(self, manager: "AccountManager"):
+        super().__init__()
+        self.manager = manager
+
+    # Reading a file (including our own reloads) does not change it
+    _IGNORED_EVENT_TYPES = frozenset(("opened", "closed_no_write"))
+
+    def on_any_event(self, event):
+        if event.event_type in self._IGNORED_EVENT_TYPES:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            path = os.fsdecode(path)
+            if path.endswith(".json"):
+                self.manager._mark_dirty(path)
 
 
 class AccountManager:
     """Manage multiple Twitter account configurations."""
 
-    def __init__(self, accounts_dir: str = "accounts"):
+    def __init__(
+        self,
+        accounts_dir: str = "accounts",
+        mtime_check_interval: float = 1.0,
+        watch: bool = True,
+    ):
         self.accounts_dir = Path(accounts_dir)
+        self.mtime_check_interval = mtime_check_interval
         self._accounts_cache = {}
-        self._last_loaded = 0
+        # False while the cache holds only accounts loaded one at a time
+        self._cache_complete = False
+        self._file_mtimes: Dict[str, int] = {}
+        # file path -> account_id for every successfully validated file
+        self._path_accounts: Dict[str, str] = {}
+        self._last_mtime_check = 0.0
+
+        # account_id -> [(path, env_var)] for every 'env:' value in the config
+        self._env_paths: Dict[str, List[Tuple[Tuple, str]]] = {}
+
+        # account_id -> config with env references resolved (or the error
+        # that prevented it), computed once per load rather than per lookup
+        self._resolved_accounts: Dict[str, Union[Dict, ConfigurationError]] = {}
+
+        # Push-based invalidation: set by the watchdog observer thread
+        self._dirty = True
+        self._dirty_lock = threading.Lock()
+        self._observer = None
+        if watch:
+            self._start_watching()
+
+    def _start_watching(self):
+        """Watch the accounts directory for changes using watchdog (inotify).
+
+        Leaves ``self._observer`` unset if watchdog is not installed, the
+        directory does not exist yet, or the platform refuses the watch; the
+        mtime-scan path in ``_should_reload_cache`` is then used instead.
+        """
+        if Observer is None or not self.accounts_dir.is_dir():
+            return
+
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(
+                _AccountsDirEventHandler(self), str(self.accounts_dir), recursive=False
+            )
+            observer.start()
+        except Exception as e:
+            logger.warning(
+                "Failed to watch accounts directory, falling back to polling",
+                accounts_dir=str(self.accounts_dir),
+                error=str(e),
+            )
+            return
+
+        self._observer = observer
+
+    def _mark_dirty(self, path: Optional[str] = None):
+        """Flag the cache for reload on the next access.
+
+        Events for ``path`` are ignored when the cache already reflects the
+        file on disk, as it does after our own ``save_account`` and
+        ``delete_account`` calls.
+        """
+        if path is not None:
+            cached_mtime = self._file_mtimes.get(path)
+            try:
+                if os.stat(path).st_mtime_ns == cached_mtime:
+                    return
+            except FileNotFoundError:
+                if cached_mtime is None:
+                    return
+            except OSError:
+                pass
+
+        with self._dirty_lock:
+            self._dirty = True
+
+    def close(self):
+        """Stop watching the accounts directory."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+
+    def __enter__(self) -> "AccountManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _scan_file_mtimes(self) -> Dict[str, int]:
+        """Map each account file path to its st_mtime_ns in one scandir pass.
+
+        ``is_file`` uses the d_type returned by getdents, so the only extra
+        syscall per file is the stat for its mtime.
+        """
+        mtimes = {}
+        with os.scandir(self.accounts_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+        return mtimes
 
     def _should_reload_cache(self) -> bool:
-        """Check if we should reload the accounts cache."""
+        """Check if we should reload the accounts cache.
+
+        When the directory is being watched this is a flag check with no
+        syscalls. Otherwise the directory is only re-scanned once every
+        ``mtime_check_interval`` seconds; in between, a populated cache is
+        trusted as-is.
+        """
+        if self._observer is not None:
+            with self._dirty_lock:
+                return self._dirty or not self._accounts_cache
+
         if not self._accounts_cache:
             return True
 
-        # Check if any account file has been modified
+        now = time.monotonic()
+        if now - self._last_mtime_check < self.mtime_check_interval:
+            return False
+        self._last_mtime_check = now
+
+        # Check if any account file has been added, removed or modified
         try:
-            latest_mtime = 0
-            for account_file in self.accounts_dir.glob("*.json"):
-                mtime = account_file.stat().st_mtime
-                if mtime > latest_mtime:
-                    latest_mtime = mtime
-
-            return latest_mtime > self._last_loaded
-        except Exception:
+            current_mtimes = self._scan_file_mtimes()
+        except OSError:
             return True
 
+        if self._cache_complete:
+            return current_mtimes != self._file_mtimes
+
+        # A partial cache only goes stale when one of its own files changes
+        return any(
+            current_mtimes.get(path) != mtime
+            for path, mtime in self._file_mtimes.items()
+        )
+
+    def _clear_cache(self):
+        """Forget every cached account so the next access re-reads from disk."""
+        self._accounts_cache = {}
+        self._file_mtimes = {}
+        self._path_accounts = {}
+        self._env_paths = {}
+        self._resolved_accounts = {}
+        self._cache_complete = False
+
+    def _invalidate_if_stale(self):
+        """Drop cached accounts whose files changed on disk.
+
+        Accounts backed by unchanged files stay cached; the cache is only
+        marked incomplete so that ``load_all_accounts`` picks up the rest.
+        """
+        if not self._should_reload_cache():
+            return
+        with self._dirty_lock:
+            self._dirty = False
+
+        try:
+            current_mtimes = self._scan_file_mtimes()
+        except OSError:
+            self._clear_cache()
+            return
+
+        for account_path, mtime in list(self._file_mtimes.items()):
+            if current_mtimes.get(account_path) != mtime:
+                self._forget_file(account_path)
+
+        self._cache_complete = (
+            self._cache_complete and current_mtimes == self._file_mtimes
+        )
+
+    def _forget_file(self, account_path: str):
+        """Drop one account file and the account parsed from it."""
+        self._file_mtimes.pop(account_path, None)
+        account_id = self._path_accounts.pop(account_path, None)
+        if account_id is not None:
+            self._accounts_cache.pop(account_id, None)
+            self._env_paths.pop(account_id, None)
+            self._resolved_accounts.pop(account_id, None)
+
+    def _read_account_file(
+        self, account_path: str
+    ) -> Tuple[Dict, List[Tuple[Tuple, str]]]:
+        """Parse and validate a single account file."""
+        with open(account_path, "rb") as f:
+            return _parse_and_validate(f.read())
+
+    def _load_account_file(self, account_id: str) -> Optional[Dict]:
+        """Load ``{account_id}.json`` into the cache without touching other files."""
+        account_path = os.path.join(self.accounts_dir, f"{account_id}.json")
+        try:
+            mtime = os.stat(account_path).st_mtime_ns
+        except OSError:
+            return None
+
+        try:
+            account_config, env_paths = self._read_account_file(account_path)
+        except Exception as e:
+            logger.error(
+                "Failed to load account configuration",
+                file=os.path.basename(account_path),
+                error=str(e),
+            )
+            return None
+
+        if account_config["account_id"] != account_id:
+            # File name does not follow the {account_id}.json convention
+            return None
+
+        self._cache_account(account_id, account_config, env_paths, account_path, mtime)
+        if len(self._file_mtimes) == 1:
+            self._last_mtime_check = time.monotonic()
+
+        if _debug_enabled():
+            logger.debug(
+                "Loaded account configuration",
+                account_id=account_id,
+                file=os.path.basename(account_path),
+            )
+        return account_config
+
+    def _cache_account(
+        self,
+        account_id: str,
+        account_config: Dict,
+        env_paths: List[Tuple[Tuple, str]],
+        account_path: str,
+        mtime: int,
+    ):
+        """Store one parsed account and its file mtime in the cache."""
+        self._accounts_cache[account_id] = account_config
+        self._env_paths[account_id] = env_paths
+        self._resolved_accounts[account_id] = _resolve_config(account_config, env_paths)
+        self._file_mtimes[account_path] = mtime
+        self._path_accounts[account_path] = account_id
+
+    def _list_account_ids_fast(self) -> List[str]:
+        """List account IDs from ``{account_id}.json`` file names without parsing."""
+        with os.scandir(self.accounts_dir) as entries:
+            return [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
+
     def load_all_accounts(self) -> Dict[str, Dict]:
         """Load all account configurations from the accounts directory."""
-        if not self._should_reload_cache():
+        if self._cache_complete and not self._should_reload_cache():
             return self._accounts_cache
 
         logger.info(
@@ -130,29 +603,63 @@ class AccountManager:
             )
             return {}
 
+        # Clear the flag before reading so changes made mid-load trigger another reload
+        with self._dirty_lock:
+            self._dirty = False
+
+        try:
+            file_mtimes = self._scan_file_mtimes()
+        except OSError as e:
+            logger.error(
+                "Failed to scan accounts directory",
+                path=str(self.accounts_dir),
+                error=str(e),
+            )
+            return {}
+
         accounts = {}
+        env_paths = {}
+        resolved_accounts = {}
+        path_accounts = {}
+
+        for account_path, mtime in file_mtimes.items():
+            # Files unchanged since they were last validated are reused as-is
+            account_id = self._path_accounts.get(account_path)
+            if (
+                account_id in self._accounts_cache
+                and self._file_mtimes.get(account_path) == mtime
+            ):
+                accounts[account_id] = self._accounts_cache[account_id]
+                env_paths[account_id] = self._env_paths[account_id]
+                resolved_accounts[account_id] = self._resolved_accounts[account_id]
+                path_accounts[account_path] = account_id
+                continue
 
-        for account_file in self.accounts_dir.glob("*.json"):
+            file_name = os.path.basename(account_path)
             try:
-                with open(account_file, "r") as f:
-                    account_config = json.load(f)
-
-                # Validate account configuration
-                self.validate_account_config(account_config)
+                account_config, account_env_paths = self._read_account_file(
+                    account_path
+                )
 
                 account_id = account_config["account_id"]
                 accounts[account_id] = account_config
-
-                logger.debug(
-                    "Loaded account configuration",
-                    account_id=account_id,
-                    file=account_file.name,
+                env_paths[account_id] = account_env_paths
+                resolved_accounts[account_id] = _resolve_config(
+                    account_config, account_env_paths
                 )
+                path_accounts[account_path] = account_id
+
+                if _debug_enabled():
+                    logger.debug(
+                        "Loaded account configuration",
+                        account_id=account_id,
+                        file=file_name,
+                    )
 
             except Exception as e:
                 logger.error(
                     "Failed to load account configuration",
-                    file=account_file.name,
+                    file=file_name,
                     error=str(e),
                 )
                 # Continue loading other accounts
@@ -160,7 +667,12 @@ class AccountManager:
 
         if accounts:
             self._accounts_cache = accounts
-            self._last_loaded = time.time()
+            self._file_mtimes = file_mtimes
+            self._env_paths = env_paths
+            self._resolved_accounts = resolved_accounts
+            self._path_accounts = path_accounts
+            self._cache_complete = True
+            self._last_mtime_check = time.monotonic()
             logger.info(
                 "Successfully loaded accounts",
                 count=len(accounts),
@@ -172,137 +684,146 @@ class AccountManager:
         return accounts
 
     def get_account(self, account_id: str) -> Optional[Dict]:
-        """Get a specific account configuration with environment variables resolved."""
-        accounts = self.load_all_accounts()
-        account = accounts.get(account_id)
+        """Get a specific account configuration with environment variables resolved.
+
+        Resolution happens when the account is loaded, so a lookup is a dict
+        fetch; see ``reload_env`` for picking up environment changes.
+
+        The returned dict is the cached one and must not be modified; code
+        that edits an account copies it and hands the copy to
+        ``save_account``.
+
+        Only ``{account_id}.json`` is read on a cache miss; the other account
+        files are left alone until something asks for all of them.
+        """
+        self._invalidate_if_stale()
+        account = self._accounts_cache.get(account_id)
+
+        if account is None and not self._cache_complete:
+            account = self._load_account_file(account_id)
+            if account is None:
+                # Fall back to a full load for files not named after their account
+                account = self.load_all_accounts().get(account_id)
 
         if not account:
             logger.warning(
                 "Account not found",
                 account_id=account_id,
-                available_accounts=list(accounts.keys()),
+                available_accounts=list(self._accounts_cache.keys()),
             )
             return None
 
-        # Resolve environment variables in the account configuration
-        try:
-            resolved_account = resolve_env_variables(account)
-            return resolved_account
-        except ConfigurationError as e:
+        resolved = self._resolved_accounts[account_id]
+        if isinstance(resolved, ConfigurationError):
             logger.error(
                 "Failed to resolve environment variables for account",
                 account_id=account_id,
-                error=str(e),
+                error=str(resolved),
             )
             return None
 
-    def get_account_ids(self) -> List[str]:
-        """Get list of all available account IDs."""
-        accounts = self.load_all_accounts()
-        return list(accounts.keys())
-
-    def validate_account_config(self, config: Dict) -> bool:
-        """Validate an account configuration."""
-        required_fields = [
-            "account_id",
-            "display_name",
-            "persona",
-            "exemplars",
-            "vector_collection",
-            "twitter_credentials",
-        ]
-
-        # Check required top-level fields
-        for field in required_fields:
-            if field not in config:
-                raise ConfigurationError(
-                    f"Missing required field in account config: {field}"
-                )
+        return resolved
 
-        # Validate account_id format
-        account_id = config["account_id"]
-        if not account_id or not isinstance(account_id, str):
-            raise ConfigurationError("account_id must be a non-empty string")
+    def reload_env(self):
+        """Re-resolve the 'env:' references of every cached account.
 
-        if not account_id.replace("_", "").replace("-", "").isalnum():
-            raise ConfigurationError(
-                "account_id must contain only alphanumeric characters, hyphens, and underscores"
+        Environment values are resolved once when an account file is loaded;
+        this re-reads .env (overriding earlier values) and resolves again.
+        """
+        load_dotenv(".env", override=True)
+        for account_id, account in self._accounts_cache.items():
+            self._resolved_accounts[account_id] = _resolve_config(
+                account, self._env_paths.get(account_id)
             )
 
-        # Validate twitter_credentials
-        twitter_creds = config["twitter_credentials"]
-        required_creds = [
-            "api_key",
-            "api_secret",
-            "access_token",
-            "access_token_secret",
-            "bearer_token",
-        ]
-
-        for cred in required_creds:
-            if cred not in twitter_creds:
-                raise ConfigurationError(f"Missing Twitter credential: {cred}")
-
-            # Check if credentials are placeholder values
-            if twitter_creds[cred].startswith("REPLACE_WITH_ACTUAL_"):
-                logger.warning(
-                    "Twitter credentials contain placeholder values",
-                    account_id=account_id,
-                    credential=cred,
-                )
-
-        # Validate exemplars structure
-        exemplars = config["exemplars"]
-        if not isinstance(exemplars, list):
-            raise ConfigurationError("exemplars must be a list")
-
-        for i, exemplar in enumerate(exemplars):
-            if not isinstance(exemplar, dict):
-                raise ConfigurationError(f"exemplar {i} must be a dictionary")
+    def get_account_ids(self) -> List[str]:
+        """Get list of all available account IDs."""
+        if not self.accounts_dir.exists():
+            return []
 
-            if "text" not in exemplar:
-                raise ConfigurationError(f"exemplar {i} missing required 'text' field")
+        try:
+            return self._list_account_ids_fast()
+        except OSError as e:
+            logger.error(
+                "Failed to list accounts directory",
+                path=str(self.accounts_dir),
+                error=str(e),
+            )
+            return []
 
-        # Validate persona
-        if not isinstance(config["persona"], str) or not config["persona"].strip():
-            raise ConfigurationError("persona must be a non-empty string")
+    def validate_account_config(self, config: Dict) -> bool:
+        """Validate an account configuration."""
+        _validate_and_find_env_paths(config)
+        return True
 
-        # Validate vector_collection
-        if (
-            not isinstance(config["vector_collection"], str)
-            or not config["vector_collection"].strip()
-        ):
-            raise ConfigurationError("vector_collection must be a non-empty string")
+    def _invalidate_clients(self, account_id: str):
+        """Drop API clients built from this account's previous credentials."""
+        # Import here to avoid circular imports (app.deps imports this module)
+        from app.deps import invalidate_clients
 
-        logger.debug(
-            "Account configuration validated successfully", account_id=account_id
-        )
-        return True
+        invalidate_clients(account_id)
 
     def save_account(self, account_config: Dict) -> bool:
-        """Save an account configuration to file."""
+        """Save an account configuration to file.
+
+        The file is replaced atomically and left untouched when its contents
+        would not change. Only this account's cache entry is refreshed.
+        """
         try:
             # Validate first
-            self.validate_account_config(account_config)
+            env_paths = _validate_and_find_env_paths(account_config)
 
             account_id = account_config["account_id"]
-            account_file = self.accounts_dir / f"{account_id}.json"
+            account_file = os.path.join(self.accounts_dir, f"{account_id}.json")
+            data = _json_dumps_indented(account_config)
+
+            try:
+                with open(account_file, "rb") as f:
+                    unchanged = f.read() == data
+            except FileNotFoundError:
+                unchanged = False
+
+            if unchanged:
+                if _debug_enabled():
+                    logger.debug(
+                        "Account configuration unchanged, skipping write",
+                        account_id=account_id,
+                    )
+                return True
 
             # Ensure accounts directory exists
             self.accounts_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save to file
-            with open(account_file, "w") as f:
-                json.dump(account_config, f, indent=2)
+            # Write to a temp file and rename over the original so readers
+            # never see a partially written config
+            tmp_file = f"{account_file}.tmp"
+            try:
+                with open(tmp_file, "wb") as f:
+                    f.write(data)
+
+                # rename() keeps the mtime, so cache it before the watcher
+                # sees the new file
+                self._cache_account(
+                    account_id,
+                    _json_loads(data),
+                    env_paths,
+                    account_file,
+                    os.stat(tmp_file).st_mtime_ns,
+                )
+                os.replace(tmp_file, account_file)
+            except OSError:
+                self._clear_cache()
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_file)
+                raise
 
             logger.info(
                 "Saved account configuration",
                 account_id=account_id,
-                file=str(account_file),
+                file=account_file,
             )
 
-            # Clear cache to force reload
-            self._accounts_cache = {}
+            self._invalidate_clients(account_id)
 
             return True
 
@@ -330,8 +851,9 @@ class AccountManager:
             account_file.unlink()
             logger.info("Deleted account configuration", account_id=account_id)
 
-            # Clear cache to force reload
-            self._accounts_cache = {}
+            # Drop only this account from the cache
+            self._forget_file(str(account_file))
+            self._invalidate_clients(account_id)
 
             return True
 
@@ -346,16 +868,28 @@ class AccountManager:
 
 # Global instance for easy access
 _account_manager = None
+_account_manager_lock = threading.Lock()
 
 
 def get_account_manager() -> AccountManager:
     """Get the global account manager instance."""
     global _account_manager
     if _account_manager is None:
-        _account_manager = AccountManager()
+        with _account_manager_lock:
+            if _account_manager is None:
+                _account_manager = AccountManager()
     return _account_manager
 
 
+def reset_account_manager():
+    """Stop and discard the global account manager (used by tests)."""
+    global _account_manager
+    with _account_manager_lock:
+        if _account_manager is not None:
+            _account_manager.close()
+        _account_manager = None
+
+
 # Convenience functions
 def load_all_accounts() -> Dict[str, Dict]:
     """Load all account configurations."""
@@ -367,6 +901,11 @@ def get_account(account_id: str) -> Optional[Dict]:
     return get_account_manager().get_account(account_id)
 
 
+def reload_env():
+    """Re-resolve environment variables for all cached accounts."""
+    get_account_manager().reload_env()
+
+
 def get_account_ids() -> List[str]:
     """Get list of all available account IDs."""
     return get_account_manager().get_account_ids()
@@ -13,11 +13,17 @@ Key Dependencies:
 - Account Data: Personas, exemplars, and settings
 
 Features:
-- Environment variable loading from config/.env
+- Environment variable loading from .env, deferred until credentials are read
 - Account-specific resource isolation
 - Backward compatibility with single-account setup
 - Graceful fallbacks for missing configurations
 - Validation of required credentials
+- File-backed settings memoized until the file's mtime/size changes, and
+  warmed at startup so the first generation does not pay for parsing
+- API and database clients built once and reused across requests, with the
+  async OpenAI client on a bounded (HTTP/2 when available) connection pool
+- Heavy client libraries (chromadb, tweepy, openai, PyYAML) imported on first
+  use, so importing this module stays cheap
 
 The dependency system enables:
 - Clean separation of concerns
@@ -27,22 +33,123 @@ The dependency system enables:
 - Centralized error handling for missing configs
 """
 
+import contextlib
+import functools
+import importlib.util
 import os
+import threading
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
-import chromadb
-import tweepy
-import yaml
-from chromadb.config import Settings
-from dotenv import load_dotenv
-from openai import OpenAI
-
-from app.account_manager import get_account, load_all_accounts
+from app.account_manager import ensure_env_loaded, get_account, load_all_accounts
 from app.exceptions import ConfigurationError
 
-# Load environment variables from .env in project root
-load_dotenv(".env")
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+except ImportError:
+    # Pure-Python fallback; json.loads decodes UTF-8 bytes itself
+    import json
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+if TYPE_CHECKING:
+    import chromadb
+    import tweepy
+    from openai import AsyncOpenAI, OpenAI
+
+# Twitter credential names, in tweepy.Client argument order: the account
+# config fields and the environment variables used without an account
+_TWITTER_CRED_FIELDS = (
+    "bearer_token",
+    "api_key",
+    "api_secret",
+    "access_token",
+    "access_token_secret",
+)
+_TWITTER_ENV_KEYS = (
+    "TWITTER_BEARER_TOKEN",
+    "TWITTER_API_KEY",
+    "TWITTER_API_SECRET",
+    "TWITTER_ACCESS_TOKEN",
+    "TWITTER_ACCESS_TOKEN_SECRET",
+)
+
+# path -> ((st_mtime_ns, st_size), parsed value)
+_file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+# Client caches. Twitter clients are keyed by account and remember the
+# credentials they were built with so that rotated credentials rebuild them.
+_clients_lock = threading.Lock()
+_twitter_clients: Dict[Optional[str], Tuple[Tuple[str, ...], "tweepy.Client"]] = {}
+_vector_db: Optional["chromadb.PersistentClient"] = None
+
+
+def _mtime_cached(path: Path, loader: Callable[[Path], Any]) -> Any:
+    """Return ``loader(path)``, re-running it only when the file changes.
+
+    Files are keyed on their mtime and size, so edits made while the process
+    is running are picked up on the next call.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _file_cache.get(str(path))
+    if hit is not None and hit[0] == key:
+        return hit[1]
+
+    value = loader(path)
+    _file_cache[str(path)] = (key, value)
+    return value
+
+
+def _load_yaml(path: Path) -> Any:
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def _load_json(path: Path) -> Any:
+    return _json_loads(path.read_bytes())
+
+
+def read_json_file(path: Path) -> Any:
+    """Parse a JSON file (read as bytes in one call)."""
+    return _load_json(Path(path))
+
+
+def write_json_file(path: Path, value: Any):
+    """Write ``value`` as compact JSON, replacing the file atomically.
+
+    The data goes to a sibling temp file that is renamed over ``path``, so
+    readers never see a partially written file.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(_json_dumps(value))
+        os.replace(tmp_path, path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+def _load_text(path: Path) -> str:
+    return path.read_text().strip()
 
 
 def get_config() -> dict:
@@ -54,23 +161,68 @@ def get_config() -> dict:
         if not config_path.exists():
             raise ConfigurationError("No configuration file found")
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
+    return _mtime_cached(config_path, _load_yaml)
+
 
-    return config
+@functools.lru_cache(maxsize=None)
+def _build_openai_client(api_key: str) -> "OpenAI":
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
 
 
-def get_openai_client() -> OpenAI:
-    """Create OpenAI client with API key from environment."""
+def get_openai_client() -> "OpenAI":
+    """Get the shared OpenAI client for the API key in the environment."""
+    ensure_env_loaded()
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ConfigurationError("OPENAI_API_KEY environment variable not set")
 
-    return OpenAI(api_key=api_key)
+    return _build_openai_client(api_key)
 
 
-def get_twitter_client(account_id: str = None) -> tweepy.Client:
-    """Create Twitter client with credentials from environment or account config."""
+@functools.lru_cache(maxsize=None)
+def _build_async_openai_client(api_key: str, max_retries: int = 3) -> "AsyncOpenAI":
+    from openai import (
+        DEFAULT_CONNECTION_LIMITS,
+        AsyncOpenAI,
+        DefaultAsyncHttpxClient,
+        Timeout,
+    )
+
+    # One pooled connection set shared by every account's concurrent calls;
+    # HTTP/2 multiplexes them over a few connections when h2 is installed.
+    # Limits comes from whichever httpx the SDK itself is built on.
+    limits_type = type(DEFAULT_CONNECTION_LIMITS)
+    http_client = DefaultAsyncHttpxClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=limits_type(max_connections=100, max_keepalive_connections=50),
+        timeout=Timeout(60.0, connect=5.0),
+    )
+    # The SDK retries 429/5xx/connection errors itself with exponential
+    # backoff and jitter, re-sending only the failed request (the prompt is
+    # not rebuilt and the vector search is not repeated)
+    return AsyncOpenAI(
+        api_key=api_key, http_client=http_client, max_retries=max_retries
+    )
+
+
+def get_async_openai_client() -> "AsyncOpenAI":
+    """Get the shared asyncio OpenAI client for the API key in the environment."""
+    ensure_env_loaded()
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ConfigurationError("OPENAI_API_KEY environment variable not set")
+
+    max_retries = get_config().get("openai", {}).get("max_retries", 3)
+    return _build_async_openai_client(api_key, max_retries)
+
+
+def get_twitter_client(account_id: str = None) -> "tweepy.Client":
+    """Get Twitter client with credentials from environment or account config.
+
+    Clients are cached per account and rebuilt when the credentials change.
+    """
     if account_id:
         # Get credentials from account configuration
         account = get_account(account_id)
@@ -78,38 +230,30 @@ def get_twitter_client(account_id: str = None) -> tweepy.Client:
             raise ConfigurationError(f"Account not found: {account_id}")
 
         creds = account["twitter_credentials"]
-        bearer_token = creds["bearer_token"]
-        api_key = creds["api_key"]
-        api_secret = creds["api_secret"]
-        access_token = creds["access_token"]
-        access_token_secret = creds["access_token_secret"]
+        creds_key = tuple(creds[field] for field in _TWITTER_CRED_FIELDS)
     else:
         # Fallback to environment variables (for backward compatibility)
-        bearer_token = os.getenv("TWITTER_BEARER_TOKEN")
-        api_key = os.getenv("TWITTER_API_KEY")
-        api_secret = os.getenv("TWITTER_API_SECRET")
-        access_token = os.getenv("TWITTER_ACCESS_TOKEN")
-        access_token_secret = os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
-
-    missing_creds = []
-    if not bearer_token:
-        missing_creds.append("TWITTER_BEARER_TOKEN")
-    if not api_key:
-        missing_creds.append("TWITTER_API_KEY")
-    if not api_secret:
-        missing_creds.append("TWITTER_API_SECRET")
-    if not access_token:
-        missing_creds.append("TWITTER_ACCESS_TOKEN")
-    if not access_token_secret:
-        missing_creds.append("TWITTER_ACCESS_TOKEN_SECRET")
+        ensure_env_loaded()
+        env = os.environ
+        creds_key = tuple(env.get(key) for key in _TWITTER_ENV_KEYS)
 
+    missing_creds = [
+        key for key, value in zip(_TWITTER_ENV_KEYS, creds_key) if not value
+    ]
     if missing_creds:
         source = f"account {account_id}" if account_id else "environment"
         raise ConfigurationError(
             f"Missing Twitter credentials from {source}: {', '.join(missing_creds)}"
         )
 
-    return tweepy.Client(
+    cached = _twitter_clients.get(account_id)
+    if cached is not None and cached[0] == creds_key:
+        return cached[1]
+
+    import tweepy
+
+    bearer_token, api_key, api_secret, access_token, access_token_secret = creds_key
+    client = tweepy.Client(
         bearer_token=bearer_token,
         consumer_key=api_key,
         consumer_secret=api_secret,
@@ -117,19 +261,65 @@ def get_twitter_client(account_id: str = None) -> tweepy.Client:
         access_token_secret=access_token_secret,
         wait_on_rate_limit=True,  # Let Tweepy handle rate limits automatically
     )
+    with _clients_lock:
+        _twitter_clients[account_id] = (creds_key, client)
 
+    return client
 
-def get_vector_db() -> chromadb.PersistentClient:
-    """Create ChromaDB client."""
-    config = get_config()
-    persist_dir = config.get("vector_db", {}).get("persist_directory", "./data/chroma")
 
-    # Ensure directory exists
-    Path(persist_dir).mkdir(parents=True, exist_ok=True)
+def get_vector_db() -> "chromadb.PersistentClient":
+    """Get the shared ChromaDB client."""
+    global _vector_db
+    if _vector_db is None:
+        with _clients_lock:
+            if _vector_db is None:
+                import chromadb
+                from chromadb.config import Settings
 
-    return chromadb.PersistentClient(
-        path=persist_dir, settings=Settings(anonymized_telemetry=False)
-    )
+                config = get_config()
+                persist_dir = config.get("vector_db", {}).get(
+                    "persist_directory", "./data/chroma"
+                )
+
+                # Ensure directory exists
+                Path(persist_dir).mkdir(parents=True, exist_ok=True)
+
+                _vector_db = chromadb.PersistentClient(
+                    path=persist_dir, settings=Settings(anonymized_telemetry=False)
+                )
+
+    return _vector_db
+
+
+def shutdown_vector_db():
+    """Release the shared ChromaDB client and its SQLite connection.
+
+    Called at application shutdown and from test teardown; the next
+    ``get_vector_db()`` call opens a fresh client.
+    """
+    global _vector_db
+    with _clients_lock:
+        client, _vector_db = _vector_db, None
+
+    if client is not None:
+        # Stops the cached chromadb System (and its SQLite pool) behind the client
+        client.clear_system_cache()
+
+
+def invalidate_clients(account_id: str = None):
+    """Drop cached API clients so they are rebuilt on next use.
+
+    With an account_id only that account's Twitter client is dropped;
+    otherwise all Twitter clients and the OpenAI clients are.
+    """
+    with _clients_lock:
+        if account_id is not None:
+            _twitter_clients.pop(account_id, None)
+            return
+
+        _twitter_clients.clear()
+    _build_openai_client.cache_clear()
+    _build_async_openai_client.cache_clear()
 
 
 def get_persona(account_id: str = None) -> str:
@@ -146,7 +336,7 @@ def get_persona(account_id: str = None) -> str:
     if not persona_path.exists():
         raise ConfigurationError("Persona file not found at data/persona.txt")
 
-    return persona_path.read_text().strip()
+    return _mtime_cached(persona_path, _load_text)
 
 
 def get_exemplars(account_id: str = None) -> list[dict]:
@@ -159,16 +349,26 @@ def get_exemplars(account_id: str = None) -> list[dict]:
         raise ConfigurationError(f"Exemplars not found for account: {account_id}")
 
     # Fallback to file (for backward compatibility)
-    import json
-
     exemplars_path = Path("data/exemplars.json")
     if not exemplars_path.exists():
         raise ConfigurationError("Exemplars file not found at data/exemplars.json")
 
-    with open(exemplars_path) as f:
-        exemplars = json.load(f)
+    return _mtime_cached(exemplars_path, _load_json)
+
+
+def warm_settings_cache():
+    """Parse config, account files and legacy persona/exemplars ahead of use."""
+    get_config()
+    for account_id in load_all_accounts():
+        # Resolves ${ENV} references once, so get_account() is a dict lookup
+        get_account(account_id)
 
-    return exemplars
+    for path, loader in (
+        (Path("data/persona.txt"), _load_text),
+        (Path("data/exemplars.json"), _load_json),
+    ):
+        if path.exists():
+            _mtime_cached(path, loader)
 
 
 def get_vector_collection_name(account_id: str = None) -> str:
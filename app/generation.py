@@ -35,47 +35,260 @@ Configuration:
 - character_limit: Twitter limit (280)
 """
 
+import asyncio
+import functools
+import itertools
+import json
+import logging
+import re
+import statistics
 import time
+from collections import deque
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import structlog
-from jinja2 import Environment, FileSystemLoader
-from openai import OpenAI
-
-from app.deps import get_config, get_exemplars, get_openai_client, get_persona
+from jinja2 import Environment, FileSystemLoader, Template
+
+from app.deps import (
+    get_async_openai_client,
+    get_config,
+    get_exemplars,
+    get_persona,
+)
 from app.exceptions import GenerationError, OpenAIError
 from app.monitoring import ActivityLogger
+from app.security import get_content_filter
 from app.vector_search import get_generation_context, get_random_seed
 
 logger = structlog.get_logger(__name__)
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Return whether debug records from this module would be emitted."""
+    return _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+
+# (prompt, completion) USD per 1K tokens. Approximate pricing - update with
+# actual pricing when available. o3/o4 bill all output tokens, reasoning included.
+_PRICING = {
+    "o3": (0.06, 0.24),
+    "o3-mini": (0.0015, 0.006),
+    "gpt-4.1": (0.0025, 0.01),
+    "gpt-4.1-mini": (0.0004, 0.0016),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4": (0.03, 0.06),
+    "gpt-3.5-turbo": (0.0015, 0.002),
+}
+
+
+def _is_reasoning_model(model: str) -> bool:
+    """Return whether the model is an o3/o4 reasoning model (Responses API)."""
+    return model.startswith(("o3", "o4"))
+
+
+def _pricing_for(model: str) -> Tuple[float, float]:
+    """Return the (prompt, completion) per-1K-token rates for a model name."""
+    if _is_reasoning_model(model):
+        return _PRICING["o3-mini" if "mini" in model.lower() else "o3"]
+    # Most specific name first, so "gpt-4.1-mini" is not priced as "gpt-4"
+    name = model.lower()
+    for family in ("gpt-4.1-mini", "gpt-4o-mini", "gpt-4.1", "gpt-4"):
+        if family in name:
+            return _PRICING[family]
+    # GPT-3.5-turbo or other
+    return _PRICING["gpt-3.5-turbo"]
+
+
+# System prompts are module constants so every call (and every account) sends
+# a byte-identical prefix, which OpenAI's server-side prompt cache keys on
+_GENERATION_SYSTEM_PROMPT = (
+    "Generate exactly one tweet, at most {target_length} characters. "
+    "Do not include quotes, prefixes, or explanations. "
+    "Just return the raw tweet text."
+)
+
+_SHORTENING_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a text editor. Shorten the given text while preserving "
+    "its core message. Return only the shortened text.",
+}
+
+
+def _batch_output_text(body: Dict[str, any]) -> str:
+    """Extract the generated text from a raw Batch API response body."""
+    if "choices" in body:
+        return body["choices"][0]["message"]["content"]
+    # Responses API: concatenate the output_text parts of message items
+    return "".join(
+        part["text"]
+        for item in body.get("output", [])
+        if item.get("type") == "message"
+        for part in item.get("content", [])
+        if part.get("type") == "output_text"
+    )
+
+
+# Opening quote -> matching closing quote, including typographic quotes
+_QUOTE_PAIRS = {'"': '"', "'": "'", "\u201c": "\u201d", "\u2018": "\u2019"}
+
+
+def _clean_llm_output(text: str) -> str:
+    """Strip whitespace and one pair of wrapping quotes from model output."""
+    text = text.strip()
+    if len(text) > 1 and _QUOTE_PAIRS.get(text[0]) == text[-1]:
+        return text[1:-1]
+    return text
+
+
+# Responses API output budget (reasoning + tweet). Starts at the ceiling
+# (openai.max_output_tokens) and is lowered to p99 of recently observed output
+# tokens plus slack once warm.
+_OUTPUT_TOKEN_CEILING = 300
+_OUTPUT_TOKEN_FLOOR = 150
+_OUTPUT_TOKEN_WINDOW = 1000
+_OUTPUT_TOKEN_REFRESH = 100
+
+# Sentence-ending punctuation followed by whitespace; match.end() is a cut point
+_SENTENCE_END = re.compile(r"[.!?](?=\s)")
+
+# Generous tokens-per-character budget for the length-bounded generation call
+_CHARS_PER_TOKEN = 2
+
+
+def _truncate_at_sentence(text: str, limit: int) -> Optional[str]:
+    """Cut text after the last whole sentence that fits within limit.
+
+    Returns None when no boundary keeps at least half of the limit, so that
+    callers can fall back to rewriting the text instead.
+    """
+    cut = None
+    for match in _SENTENCE_END.finditer(text, 0, limit + 1):
+        cut = match.end()
+    if cut is None or cut < limit // 2:
+        return None
+    return text[:cut]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_prompt_env() -> Environment:
+    """Shared Jinja2 environment for the prompt templates.
+
+    Templates are compiled once per process; ``auto_reload`` is off so
+    rendering never stats the template files.
+    """
+    return Environment(
+        loader=FileSystemLoader("prompts"),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=400,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_prompt_template(name: str) -> Template:
+    """Return the compiled prompt template with the given file name."""
+    return _get_prompt_env().get_template(name)
+
+
+@dataclass(slots=True)
+class GenerationResult:
+    """A generated tweet and the seed it came from."""
+
+    tweet_text: str
+    seed_chunk_hash: str
+    seed_chunk_id: str
+    seed_source: str
+    context_chunks_count: int
+    character_count: int
+    generation_time_ms: int
+    was_shortened: bool
+    test_mode: bool = False
 
 
 class TweetGenerator:
     """Generate tweets using OpenAI API and context from vector database."""
 
-    def __init__(self, account_id: str = None):
-        self.openai_client = get_openai_client()
+    def __init__(
+        self,
+        account_id: str = None,
+        model: Optional[str] = None,
+    ):
+        self.openai_client = get_async_openai_client()
         self.activity_logger = ActivityLogger()
         self.account_id = account_id
 
         # Load configuration
         config = get_config()
-        self.model = config.get("openai", {}).get(
-            "model", "o3"
-        )  # Default to o3 reasoning
+        self._config = config
+        # A cheap chat model by default; o3 is opt-in, e.g. as the fallback model
+        self.model = model or config.get("openai", {}).get("model", "gpt-4.1-mini")
+        self.fallback_model = config.get("openai", {}).get("fallback_model")
         self.shortening_model = config.get("openai", {}).get(
             "shortening_model", "gpt-4.1"
         )
         self.max_tokens = config.get("openai", {}).get("max_tokens", 150)
         self.temperature = config.get("openai", {}).get("temperature", 0.8)
         self.character_limit = config.get("twitter", {}).get("character_limit", 280)
-
-        # Setup Jinja2 for prompt templates
-        self.jinja_env = Environment(
-            loader=FileSystemLoader("prompts"), trim_blocks=True, lstrip_blocks=True
+        self.prompt_rate, self.completion_rate = _pricing_for(self.model)
+        self.shortening_rates = _pricing_for(self.shortening_model)
+        self._uses_responses_api = _is_reasoning_model(self.model)
+        # Several candidates are requested so a fitting, safe one can be picked
+        # without re-prompting or shortening. Chat models return them from one
+        # call; the Responses API has no ``n``, so reasoning models need one
+        # concurrent call per candidate and default to a single call.
+        self.candidates = (
+            config.get("openai", {}).get("reasoning_candidates", 1)
+            if self._uses_responses_api
+            else config.get("openai", {}).get("candidates", 3)
+        )
+        # Recent Responses API output token counts and the budget derived from them
+        self._output_token_samples = deque(maxlen=_OUTPUT_TOKEN_WINDOW)
+        self._samples_since_refresh = 0
+        # Tweets are a shallow creative task; low effort keeps reasoning short
+        self.reasoning_effort = config.get("openai", {}).get("reasoning_effort", "low")
+        self._reasoning = {"effort": self.reasoning_effort}
+        self.output_token_ceiling = config.get("openai", {}).get(
+            "max_output_tokens", _OUTPUT_TOKEN_CEILING
+        )
+        self.reasoning_output_limit = self.output_token_ceiling
+        # LLM shortening round trips made by this generator
+        self.shortening_calls = 0
+
+        # Ask for a tweet that already fits so the shortening call is rare
+        self.target_length = self.character_limit - 10  # Leave some buffer
+        self.system_prompt = _GENERATION_SYSTEM_PROMPT.format(
+            target_length=self.target_length
+        )
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        self.output_token_limit = min(
+            self.max_tokens, self.target_length // _CHARS_PER_TOKEN
         )
 
+        # Jinja2 environment for prompt templates (shared across generators)
+        self.jinja_env = _get_prompt_env()
+        self._prefix_template = _get_prompt_template("persona_prefix.j2")
+        self._suffix_template = _get_prompt_template("context_suffix.j2")
+        self._shortening_template = _get_prompt_template("shortening_prompt.j2")
+        # (persona, exemplar texts, rendered prefix) from the last prompt built
+        self._prompt_prefix = None
+
+    def _get_prompt_prefix(self, persona: str, exemplars: List[Dict[str, any]]) -> str:
+        """Render the static persona/exemplar part of the generation prompt."""
+        # Keyed on content: the template only reads each exemplar's text, and
+        # a list edited in place must not keep serving the old prefix
+        texts = tuple(e.get("text") for e in exemplars)
+        cached = self._prompt_prefix
+        if cached is not None and cached[0] == persona and cached[1] == texts:
+            return cached[2]
+
+        prefix = self._prefix_template.render(persona=persona, exemplars=exemplars)
+        self._prompt_prefix = (persona, texts, prefix)
+        return prefix
+
     def check_cost_limits(self) -> bool:
         """Check if we're within cost limits before generating."""
         # Cost tracking removed for simplification
@@ -87,20 +300,26 @@ class TweetGenerator:
         exemplars: List[Dict[str, any]],
         persona: str,
     ) -> str:
-        """Build the tweet generation prompt using Jinja2 template."""
-        try:
-            template = self.jinja_env.get_template("base_prompt.j2")
+        """Build the tweet generation prompt using Jinja2 template.
 
-            prompt = template.render(
-                persona=persona, context_chunks=context_chunks, exemplars=exemplars
-            )
-
-            logger.debug(
-                "Generation prompt built",
-                prompt_length=len(prompt),
-                context_chunks_count=len(context_chunks),
-                exemplars_count=len(exemplars),
-            )
+        The persona/exemplar prefix is rendered once and reused while the
+        account's persona and exemplars are unchanged; only the context
+        suffix is rendered per call.
+        """
+        try:
+            prefix = self._get_prompt_prefix(persona, exemplars)
+            # Join the cached prefix with the suffix's fragments in one pass
+            # rather than rendering the suffix to a string and concatenating
+            fragments = self._suffix_template.generate(context_chunks=context_chunks)
+            prompt = "".join(itertools.chain((prefix,), fragments))
+
+            if _debug_enabled():
+                logger.debug(
+                    "Generation prompt built",
+                    prompt_length=len(prompt),
+                    context_chunks_count=len(context_chunks),
+                    exemplars_count=len(exemplars),
+                )
 
             return prompt
 
@@ -108,60 +327,100 @@ class TweetGenerator:
             logger.error("Failed to build generation prompt", error=str(e))
             raise GenerationError(f"Failed to build prompt: {str(e)}")
 
-    def call_openai_for_generation(self, prompt: str) -> str:
+    def _pick_candidate(self, candidates: List[str]) -> str:
+        """Return the first candidate that fits and passes the local safety rules.
+
+        Falls back to the first safe candidate, then to the first candidate;
+        the full content filter still runs before anything is posted.
+        """
+        if len(candidates) == 1:
+            return candidates[0]
+
+        content_filter = get_content_filter()
+        safe = [c for c in candidates if content_filter.is_locally_safe(c)]
+        for candidate in safe:
+            if len(candidate) <= self.target_length:
+                return candidate
+        return safe[0] if safe else candidates[0]
+
+    def _record_output_tokens(self, output_tokens: int):
+        """Track Responses API output usage and periodically re-derive the cap."""
+        self._output_token_samples.append(output_tokens)
+        self._samples_since_refresh += 1
+        if self._samples_since_refresh < _OUTPUT_TOKEN_REFRESH:
+            return
+
+        self._samples_since_refresh = 0
+        p99 = statistics.quantiles(self._output_token_samples, n=100)[-1]
+        self.reasoning_output_limit = min(
+            self.output_token_ceiling, max(_OUTPUT_TOKEN_FLOOR, int(p99 * 1.2))
+        )
+        if _debug_enabled():
+            logger.debug(
+                "Adjusted reasoning output token limit",
+                p99=p99,
+                max_output_tokens=self.reasoning_output_limit,
+            )
+
+    async def call_openai_for_generation(self, prompt: str) -> str:
         """Call OpenAI API to generate tweet."""
         try:
-            logger.debug("Calling OpenAI for tweet generation", model=self.model)
+            if _debug_enabled():
+                logger.debug("Calling OpenAI for tweet generation", model=self.model)
+
+            # Only the user message changes between calls
+            messages = [self._system_message, {"role": "user", "content": prompt}]
 
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
             # Check if using o3/o4 reasoning model - use Responses API
-            if self.model.startswith(("o3", "o4")):
+            if self._uses_responses_api:
                 # Use Responses API for reasoning models
-                response = self.openai_client.responses.create(
-                    model=self.model,
-                    reasoning={
-                        "effort": "medium"
-                    },  # Medium reasoning effort for creative but focused tasks
-                    input=[
-                        {
-                            "role": "system",
-                            "content": "Generate exactly one tweet. Do not include quotes, prefixes, or explanations. Just return the raw tweet text.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    max_output_tokens=300,  # Reserve space for reasoning + output
+                responses = await asyncio.gather(
+                    *(
+                        self.openai_client.responses.create(
+                            model=self.model,
+                            reasoning=self._reasoning,
+                            input=messages,
+                            # Reserve space for reasoning + output
+                            max_output_tokens=self.reasoning_output_limit,
+                        )
+                        for _ in range(self.candidates)
+                    )
                 )
                 # Extract tweet from response
-                tweet_text = response.output_text.strip()
-
-                # Get usage stats from reasoning model response
-                usage = response.usage
-                prompt_tokens = usage.input_tokens
-                completion_tokens = usage.output_tokens
-                total_tokens = usage.total_tokens
-                reasoning_tokens = (
-                    getattr(usage.output_tokens_details, "reasoning_tokens", 0)
-                    if hasattr(usage, "output_tokens_details")
-                    else 0
+                tweet_text = self._pick_candidate(
+                    [_clean_llm_output(r.output_text) for r in responses]
                 )
 
+                # Get usage stats from reasoning model responses
+                prompt_tokens = completion_tokens = total_tokens = 0
+                reasoning_tokens = 0
+                for response in responses:
+                    usage = response.usage
+                    prompt_tokens += usage.input_tokens
+                    completion_tokens += usage.output_tokens
+                    total_tokens += usage.total_tokens
+                    reasoning_tokens += getattr(
+                        getattr(usage, "output_tokens_details", None),
+                        "reasoning_tokens",
+                        0,
+                    )
+                    self._record_output_tokens(usage.output_tokens)
+
             else:
                 # Use Chat Completions API for non-reasoning models (gpt-4o, etc.)
-                response = self.openai_client.chat.completions.create(
+                response = await self.openai_client.chat.completions.create(
                     model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "Generate exactly one tweet. Do not include quotes, prefixes, or explanations. Just return the raw tweet text.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    max_tokens=self.max_tokens,
+                    messages=messages,
+                    max_tokens=self.output_token_limit,
                     temperature=self.temperature,
+                    n=self.candidates,
                 )
                 # Extract tweet from chat completion
-                tweet_text = response.choices[0].message.content.strip()
+                tweet_text = self._pick_candidate(
+                    [_clean_llm_output(c.message.content) for c in response.choices]
+                )
 
                 # Get usage stats from chat completion
                 usage = response.usage
@@ -169,32 +428,13 @@ class TweetGenerator:
                 completion_tokens = usage.completion_tokens
                 total_tokens = usage.total_tokens
                 reasoning_tokens = 0
-            api_time = time.time() - start_time
-
-            # Remove quotes if they were added
-            if (tweet_text.startswith('"') and tweet_text.endswith('"')) or (
-                tweet_text.startswith("'") and tweet_text.endswith("'")
-            ):
-                tweet_text = tweet_text[1:-1]
-
-            # Cost calculation based on model type
-            if self.model.startswith(("o3", "o4")):
-                # o3/o4 reasoning models - note: all output tokens (including reasoning) are billed
-                # Approximate pricing - update with actual pricing when available
-                if "mini" in self.model.lower():
-                    cost = (prompt_tokens * 0.0015 + completion_tokens * 0.006) / 1000
-                else:
-                    cost = (
-                        prompt_tokens * 0.06 + completion_tokens * 0.24
-                    ) / 1000  # Full o3/o4 pricing
-            elif "gpt-4.1" in self.model.lower():
-                # GPT-4.1 pricing (update with actual pricing when available)
-                cost = (prompt_tokens * 0.0025 + completion_tokens * 0.01) / 1000
-            elif "gpt-4" in self.model.lower():
-                # GPT-4 pricing
-                cost = (prompt_tokens * 0.03 + completion_tokens * 0.06) / 1000
-            else:  # GPT-3.5-turbo or other
-                cost = (prompt_tokens * 0.0015 + completion_tokens * 0.002) / 1000
+            api_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+            # Cost calculation from the rates resolved for this model
+            cost = (
+                prompt_tokens * self.prompt_rate
+                + completion_tokens * self.completion_rate
+            ) / 1000
 
             # Cost tracking removed for simplification
 
@@ -205,7 +445,7 @@ class TweetGenerator:
                 reasoning_tokens=reasoning_tokens,
                 cost_usd=cost,
                 tweet_length=len(tweet_text),
-                api_time_ms=int(api_time * 1000),
+                api_time_ms=api_time_ms,
             )
 
             return tweet_text
@@ -214,56 +454,68 @@ class TweetGenerator:
             logger.error("OpenAI generation failed", model=self.model, error=str(e))
             raise OpenAIError(f"Tweet generation failed: {str(e)}")
 
-    def shorten_tweet_if_needed(self, tweet_text: str) -> str:
+    async def shorten_tweet_if_needed(self, tweet_text: str) -> str:
         """Shorten tweet if it exceeds character limit."""
         if len(tweet_text) <= self.character_limit:
             return tweet_text
 
+        # Dropping trailing sentences is free; only rewrite when that loses too much
+        truncated = _truncate_at_sentence(tweet_text, self.target_length)
+        if truncated is not None:
+            logger.info(
+                "Tweet too long, trimmed at sentence boundary",
+                original_length=len(tweet_text),
+                shortened_length=len(truncated),
+            )
+            return truncated
+
+        # Should be rare now that generation is length-bounded; counted so the
+        # prompt/token limits can be re-tuned if it creeps up
+        self.shortening_calls += 1
         logger.info(
             "Tweet too long, attempting to shorten",
+            account_id=self.account_id,
             original_length=len(tweet_text),
             limit=self.character_limit,
+            shortening_triggered=True,
+            shortening_calls=self.shortening_calls,
         )
 
         try:
             # Build shortening prompt
-            template = self.jinja_env.get_template("shortening_prompt.j2")
-            shortening_prompt = template.render(
+            shortening_prompt = self._shortening_template.render(
                 tweet_text=tweet_text,
                 current_length=len(tweet_text),
-                target_length=self.character_limit - 10,  # Leave some buffer
+                target_length=self.target_length,
             )
 
             # Call OpenAI for shortening
-            start_time = time.time()
-            response = self.openai_client.chat.completions.create(
+            start_ns = time.perf_counter_ns()
+            response = await self.openai_client.chat.completions.create(
                 model=self.shortening_model,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a text editor. Shorten the given text while preserving its core message. Return only the shortened text.",
-                    },
+                    _SHORTENING_SYSTEM_MESSAGE,
                     {"role": "user", "content": shortening_prompt},
                 ],
                 max_tokens=100,
                 temperature=0.3,  # Lower temperature for more focused editing
             )
-            api_time = time.time() - start_time
-
-            shortened_text = response.choices[0].message.content.strip()
+            api_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
-            # Remove quotes if added
-            if (shortened_text.startswith('"') and shortened_text.endswith('"')) or (
-                shortened_text.startswith("'") and shortened_text.endswith("'")
-            ):
-                shortened_text = shortened_text[1:-1]
+            shortened_text = _clean_llm_output(response.choices[0].message.content)
 
-            # Cost tracking removed for simplification
+            prompt_rate, completion_rate = self.shortening_rates
+            cost = (
+                response.usage.prompt_tokens * prompt_rate
+                + response.usage.completion_tokens * completion_rate
+            ) / 1000
 
             logger.info(
                 "Tweet shortened successfully",
                 original_length=len(tweet_text),
                 shortened_length=len(shortened_text),
+                cost_usd=cost,
+                api_time_ms=api_time_ms,
             )
 
             return shortened_text
@@ -277,56 +529,109 @@ class TweetGenerator:
             )
             return truncated
 
-    def generate_tweet(self, test_mode: bool = False) -> Dict[str, any]:
-        """Generate a complete tweet with context and persona."""
-        generation_start = time.time()
+    def _get_seed_and_context(
+        self,
+    ) -> Tuple[Dict[str, any], str, List[Dict[str, any]]]:
+        """Pick a seed chunk and fetch its context (blocking vector search)."""
+        seed_chunk, seed_hash = get_random_seed(account_id=self.account_id)
+        context_chunks = get_generation_context(seed_chunk, account_id=self.account_id)
+        return seed_chunk, seed_hash, context_chunks
+
+    def _draw_batch_seeds(
+        self, count: int
+    ) -> List[Tuple[Dict[str, any], str, List[Dict[str, any]]]]:
+        """Pick up to ``count`` distinct seed chunks with their context.
+
+        Seeds are drawn at random, so repeats are skipped; a small collection
+        may yield fewer than ``count`` seeds once the draws run out.
+        """
+        seeds = {}
+        for _ in range(count * 3):
+            if len(seeds) == count:
+                break
+            seed_chunk, seed_hash = get_random_seed(account_id=self.account_id)
+            if seed_chunk["id"] not in seeds:
+                seeds[seed_chunk["id"]] = (seed_chunk, seed_hash)
+        return [
+            (
+                seed_chunk,
+                seed_hash,
+                get_generation_context(seed_chunk, account_id=self.account_id),
+            )
+            for seed_chunk, seed_hash in seeds.values()
+        ]
+
+    async def generate_tweet(
+        self, test_mode: bool = False, persona: Optional[str] = None
+    ) -> GenerationResult:
+        """Generate a complete tweet with context and persona.
+
+        ``persona`` replaces the account's persona for this call only (used for
+        test tweets), so the shared generator is never modified.
+        """
+        generation_start = time.perf_counter_ns()
 
         try:
             # Check cost limits
             self.check_cost_limits()
 
-            # Step 1: Get random seed chunk with deduplication
+            # Steps 1-2: Get random seed chunk and its context. Vector search is
+            # synchronous, so it runs in one worker thread while the loop
+            # loads the persona and exemplars below
             logger.info("Starting tweet generation", account_id=self.account_id)
-            seed_chunk, seed_hash = get_random_seed(account_id=self.account_id)
-
-            # Step 2: Get context chunks
-            context_chunks = get_generation_context(
-                seed_chunk, account_id=self.account_id
+            search_task = asyncio.create_task(
+                asyncio.to_thread(self._get_seed_and_context)
             )
 
-            # Step 3: Load persona and exemplars
-            persona = get_persona(account_id=self.account_id)
-            exemplars = get_exemplars(account_id=self.account_id)
+            # Step 3: Load persona and exemplars (memoized, so cheap on the loop)
+            try:
+                if persona is None:
+                    persona = get_persona(account_id=self.account_id)
+                exemplars = get_exemplars(account_id=self.account_id)
+            except BaseException:
+                search_task.cancel()
+                raise
+
+            seed_chunk, seed_hash, context_chunks = await search_task
 
             # Step 4: Build prompt
             prompt = self.build_generation_prompt(context_chunks, exemplars, persona)
 
             # Step 5: Generate tweet
-            tweet_text = self.call_openai_for_generation(prompt)
+            tweet_text = await self.call_openai_for_generation(prompt)
 
             # Step 6: Check and shorten if needed
-            final_tweet = self.shorten_tweet_if_needed(tweet_text)
-
-            generation_time = int((time.time() - generation_start) * 1000)
-
-            result = {
-                "tweet_text": final_tweet,
-                "seed_chunk_hash": seed_hash,
-                "seed_chunk_id": seed_chunk["id"],
-                "seed_source": seed_chunk["metadata"].get("source_title", "Unknown"),
-                "context_chunks_count": len(context_chunks),
-                "character_count": len(final_tweet),
-                "generation_time_ms": generation_time,
-                "was_shortened": len(tweet_text) != len(final_tweet),
-                "test_mode": test_mode,
-            }
+            final_tweet = await self.shorten_tweet_if_needed(tweet_text)
 
-            logger.info("Tweet generation complete", **result)
+            generation_time = (time.perf_counter_ns() - generation_start) // 1_000_000
+            character_count = len(final_tweet)
+            was_shortened = character_count != len(tweet_text)
+
+            result = GenerationResult(
+                tweet_text=final_tweet,
+                seed_chunk_hash=seed_hash,
+                seed_chunk_id=seed_chunk["id"],
+                seed_source=seed_chunk["metadata"].get("source_title", "Unknown"),
+                context_chunks_count=len(context_chunks),
+                character_count=character_count,
+                generation_time_ms=generation_time,
+                was_shortened=was_shortened,
+                test_mode=test_mode,
+            )
+
+            logger.info(
+                "Tweet generation complete",
+                account_id=self.account_id,
+                seed_chunk_id=seed_chunk["id"],
+                character_count=character_count,
+                generation_time_ms=generation_time,
+                was_shortened=was_shortened,
+            )
 
             return result
 
         except Exception as e:
-            generation_time = int((time.time() - generation_start) * 1000)
+            generation_time = (time.perf_counter_ns() - generation_start) // 1_000_000
             logger.error(
                 "Tweet generation failed",
                 error=str(e),
@@ -345,43 +650,231 @@ class TweetGenerator:
 
             raise GenerationError(f"Tweet generation failed: {str(e)}")
 
+    def _batch_request_body(self, prompt: str) -> Tuple[str, Dict[str, any]]:
+        """Return the (endpoint, body) of a Batch API request for one prompt."""
+        messages = [self._system_message, {"role": "user", "content": prompt}]
+        if self._uses_responses_api:
+            return "/v1/responses", {
+                "model": self.model,
+                "reasoning": self._reasoning,
+                "input": messages,
+                "max_output_tokens": self.reasoning_output_limit,
+            }
+        return "/v1/chat/completions", {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": self.output_token_limit,
+            "temperature": self.temperature,
+        }
+
+    async def submit_generation_batch(self, count: int) -> str:
+        """Queue ``count`` tweet generations on the OpenAI Batch API.
+
+        Batch requests are billed at half price and completed within 24 hours,
+        which suits pre-generating a day's tweets; real-time posts keep using
+        ``generate_tweet``. Returns the batch ID to pass to
+        ``fetch_generation_batch``.
+        """
+        if count < 1:
+            raise GenerationError(f"Batch size must be at least 1, got {count}")
+
+        persona = get_persona(account_id=self.account_id)
+        exemplars = get_exemplars(account_id=self.account_id)
+        seeds = await asyncio.to_thread(self._draw_batch_seeds, count)
+        if len(seeds) < count:
+            logger.warning(
+                "Fewer distinct seeds than requested for batch",
+                account_id=self.account_id,
+                requested=count,
+                distinct=len(seeds),
+            )
+
+        lines = []
+        for index, (seed_chunk, seed_hash, context_chunks) in enumerate(seeds):
+            prompt = self.build_generation_prompt(context_chunks, exemplars, persona)
+            endpoint, body = self._batch_request_body(prompt)
+            lines.append(
+                json.dumps(
+                    {
+                        # Carries the seed through to the results
+                        "custom_id": f"{index}|{seed_hash}|{seed_chunk['id']}",
+                        "method": "POST",
+                        "url": endpoint,
+                        "body": body,
+                    }
+                )
+            )
+
+        batch_file = await self.openai_client.files.create(
+            file=("tweets.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        batch = await self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=endpoint,
+            completion_window="24h",
+            metadata={"account_id": self.account_id or ""},
+        )
+        logger.info(
+            "Submitted tweet generation batch",
+            account_id=self.account_id,
+            batch_id=batch.id,
+            count=len(lines),
+        )
+        return batch.id
+
+    async def fetch_generation_batch(
+        self, batch_id: str
+    ) -> Optional[List[Dict[str, any]]]:
+        """Return the tweets of a finished batch, or None while it is running."""
+        batch = await self.openai_client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            logger.debug(
+                "Generation batch not ready", batch_id=batch_id, status=batch.status
+            )
+            return None
+
+        # Failed requests land in the error file; when every request failed
+        # there is no output file at all
+        lines = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self.openai_client.files.content(file_id)
+                lines.extend(content.text.splitlines())
+
+        content_filter = get_content_filter()
+        results = []
+        for line in lines:
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.warning(
+                    "Batch generation request failed",
+                    batch_id=batch_id,
+                    custom_id=record.get("custom_id"),
+                    error=record.get("error"),
+                )
+                continue
+
+            _, seed_hash, seed_chunk_id = record["custom_id"].split("|", 2)
+            tweet_text = _clean_llm_output(_batch_output_text(response["body"]))
+            final_tweet = await self.shorten_tweet_if_needed(tweet_text)
+            if not content_filter.is_locally_safe(final_tweet):
+                logger.warning(
+                    "Batch tweet failed safety filters",
+                    batch_id=batch_id,
+                    custom_id=record["custom_id"],
+                )
+                continue
+            results.append(
+                {
+                    "tweet_text": final_tweet,
+                    "seed_chunk_hash": seed_hash,
+                    "seed_chunk_id": seed_chunk_id,
+                    "character_count": len(final_tweet),
+                    "was_shortened": len(final_tweet) != len(tweet_text),
+                }
+            )
+        return results
+
+
+# account_id -> generator, rebuilt when the config or OpenAI client changes
+_generators: Dict[Tuple[Optional[str], Optional[str]], TweetGenerator] = {}
+
+
+def get_generator(
+    account_id: Optional[str], model: Optional[str] = None
+) -> TweetGenerator:
+    """Return a reusable TweetGenerator for the account (and model override).
+
+    ``get_config`` and ``get_async_openai_client`` return the same objects until the
+    config file or API key changes, so an identity check is enough to spot a
+    stale generator.
+    """
+    key = (account_id, model)
+    generator = _generators.get(key)
+    if (
+        generator is None
+        or generator._config is not get_config()
+        or generator.openai_client is not get_async_openai_client()
+    ):
+        generator = TweetGenerator(account_id=account_id, model=model)
+        _generators[key] = generator
+    return generator
+
+
+async def generate_tweets_bulk(
+    account_ids: List[Optional[str]], test_mode: bool = False
+) -> List[GenerationResult]:
+    """Generate one tweet per account concurrently, without posting.
+
+    Results are returned in ``account_ids`` order; an account whose
+    generation failed gets its exception in place of a result.
+    """
+    return await asyncio.gather(
+        *(
+            get_generator(account_id).generate_tweet(test_mode=test_mode)
+            for account_id in account_ids
+        ),
+        return_exceptions=True,
+    )
+
 
 async def generate_and_post_tweet(account_id: str = None) -> Dict[str, any]:
     """Generate and post content to all platforms (main entry point)."""
     from app.multi_platform_poster import MultiPlatformPoster
-    from app.security import ContentFilter
 
-    generator = TweetGenerator(account_id=account_id)
+    generator = get_generator(account_id)
+    generation_result = None
 
     try:
         # Generate tweet
-        generation_result = generator.generate_tweet()
+        generation_result = await generator.generate_tweet()
 
-        # Filter content
-        content_filter = ContentFilter()
-        if not content_filter.is_content_safe(generation_result["tweet_text"]):
+        # Filter content (the moderation call is blocking, so run it off the loop)
+        content_filter = get_content_filter()
+        is_safe = await asyncio.to_thread(
+            content_filter.is_content_safe, generation_result.tweet_text
+        )
+        if not is_safe and generator.fallback_model:
+            # One retry on the (usually stronger) fallback model
+            logger.info(
+                "Retrying generation with fallback model",
+                account_id=account_id,
+                model=generator.fallback_model,
+            )
+            generator = get_generator(account_id, model=generator.fallback_model)
+            # The rejected tweet must not be logged as the failed post
+            generation_result = None
+            try:
+                generation_result = await generator.generate_tweet()
+            except Exception as e:
+                raise GenerationError(f"Fallback generation failed: {e}") from e
+            is_safe = await asyncio.to_thread(
+                content_filter.is_content_safe, generation_result.tweet_text
+            )
+        if not is_safe:
             raise GenerationError("Generated content failed safety filters")
 
         # Post to all platforms
         multi_poster = MultiPlatformPoster(account_id=account_id)
         post_result = await multi_poster.post_to_all_platforms(
-            generation_result["tweet_text"]
+            generation_result.tweet_text
         )
 
         # Log successful post
         platforms_attempted = post_result.get("platforms", {}).get("attempted", [])
         generator.activity_logger.log_post_attempt(
-            tweet_text=generation_result["tweet_text"],
-            seed_chunk_hash=generation_result["seed_chunk_hash"],
+            tweet_text=generation_result.tweet_text,
+            seed_chunk_hash=generation_result.seed_chunk_hash,
             status=post_result.get("status", "unknown"),
             twitter_id=None,  # Will be handled by platform-specific logging in multi_poster
-            generation_time_ms=generation_result["generation_time_ms"],
+            generation_time_ms=generation_result.generation_time_ms,
             account_id=account_id,
             platforms=platforms_attempted,
             metadata={
-                "seed_source": generation_result["seed_source"],
-                "was_shortened": generation_result["was_shortened"],
-                "character_count": generation_result["character_count"],
+                "seed_source": generation_result.seed_source,
+                "was_shortened": generation_result.was_shortened,
+                "character_count": generation_result.character_count,
                 "account_id": account_id,
                 "platforms": post_result.get("platforms", {}),
                 "multi_platform_result": post_result,
@@ -389,7 +882,7 @@ async def generate_and_post_tweet(account_id: str = None) -> Dict[str, any]:
         )
 
         return {
-            **generation_result,
+            **asdict(generation_result),
             **post_result,
             "status": post_result.get("status", "unknown"),
         }
@@ -399,17 +892,15 @@ async def generate_and_post_tweet(account_id: str = None) -> Dict[str, any]:
 
         # Log the failed attempt
         generator.activity_logger.log_post_attempt(
-            tweet_text=generation_result.get("tweet_text", "")
-            if "generation_result" in locals()
-            else "",
-            seed_chunk_hash=generation_result.get("seed_chunk_hash", "")
-            if "generation_result" in locals()
-            else "",
+            tweet_text=generation_result.tweet_text if generation_result else "",
+            seed_chunk_hash=(
+                generation_result.seed_chunk_hash if generation_result else ""
+            ),
             status="failed",
             error_message=str(e),
-            generation_time_ms=generation_result.get("generation_time_ms")
-            if "generation_result" in locals()
-            else None,
+            generation_time_ms=(
+                generation_result.generation_time_ms if generation_result else None
+            ),
             account_id=account_id,
         )
 
@@ -420,30 +911,14 @@ async def generate_test_tweet(
     custom_persona: Optional[str] = None, account_id: str = None
 ) -> Dict[str, any]:
     """Generate a test tweet without posting."""
-    generator = TweetGenerator(account_id=account_id)
+    generator = get_generator(account_id)
 
     try:
-        # Override persona if provided
-        if custom_persona:
-            original_get_persona = get_persona
-
-            def mock_get_persona(account_id_param: str = None):
-                return custom_persona
-
-            # Temporarily replace the function
-            import app.deps
-
-            app.deps.get_persona = mock_get_persona
+        result = await generator.generate_tweet(
+            test_mode=True, persona=custom_persona or None
+        )
 
-            try:
-                result = generator.generate_tweet(test_mode=True)
-            finally:
-                # Restore original function
-                app.deps.get_persona = original_get_persona
-        else:
-            result = generator.generate_tweet(test_mode=True)
-
-        return {**result, "status": "success"}
+        return {**asdict(result), "status": "success"}
 
     except Exception as e:
         logger.error(
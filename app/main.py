@@ -27,23 +27,70 @@ various subsystems (generation, scheduling, monitoring, security) through depend
 """
 
 import asyncio
+import hashlib
 import os
+import signal
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
+import jinja2
 import structlog
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, Form, HTTPException, Query, Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from app.account_manager import get_account, get_account_ids, load_all_accounts
-from app.deps import get_config
+from app.account_manager import (
+    get_account,
+    get_account_ids,
+    get_account_manager,
+    load_all_accounts,
+    reload_env,
+)
+from app.deps import (
+    get_config,
+    read_json_file,
+    shutdown_vector_db,
+    warm_settings_cache,
+    write_json_file,
+)
 from app.exceptions import ZenKinkBotException
-from app.monitoring import ActivityLogger, CostTracker, HealthChecker
+from app.generation import generate_and_post_tweet, generate_test_tweet, get_generator
+from app.monitoring import (
+    ActivityLogger,
+    CostTracker,
+    HealthChecker,
+    flush_costs_periodically,
+)
+from app.multi_platform_poster import (
+    MultiPlatformPoster,
+    get_platform_info,
+    test_all_platform_connections,
+)
+from app.scheduler import (
+    get_scheduler,
+    get_scheduler_status,
+    start_scheduler,
+    stop_scheduler,
+)
+from app.security import get_content_filter, validate_user_input
+from app.vector_search import search_knowledge_base
+
+try:
+    import orjson
+
+    class _JSONResponse(JSONResponse):
+        """JSONResponse serialized with orjson."""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    _JSONResponse = JSONResponse
 
 # Load environment variables from config/.env
 load_dotenv("config/.env")
@@ -55,15 +102,44 @@ logger = structlog.get_logger(__name__)
 cost_tracker = None
 activity_logger = None
 health_checker = None
-emergency_stop = False
+
+# Set while the emergency stop is active; checked by handlers and scheduled jobs
+emergency_stop_event = asyncio.Event()
+
+# The shallow health check is shared by the dashboard, /health and the status
+# APIs; a result this recent is reused instead of probing again
+_HEALTH_TTL_SECONDS = 1.0
+_health_cache: Optional[Tuple[float, dict]] = None
+_health_lock = asyncio.Lock()
+
+# Platform info makes a live profile request per platform; the dashboard's
+# repeat lookups for an account within this window reuse the last answer
+_PLATFORM_INFO_TTL_SECONDS = 5.0
+_platform_info_cache: Dict[str, Tuple[float, dict]] = {}
+
+# Bounds for the knowledge base search box, checked before any embedding or
+# vector query runs
+_SEARCH_QUERY_MAX_LENGTH = 500
+_SEARCH_LIMIT_MAX = 100
+
+# Serializes read-modify-write of the global exemplars file now that its
+# reads and writes yield to the event loop
+_exemplars_lock = asyncio.Lock()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup application resources."""
     global cost_tracker, activity_logger, health_checker
+    cost_flush_task = None
 
     try:
+        # Parse config, account files and the UI templates now rather than on
+        # the first request
+        warm_settings_cache()
+        for name in templates.env.list_templates(extensions=["html"]):
+            templates.get_template(name)
+
         # Initialize monitoring components
         config = get_config()
         daily_limit = config.get("cost_limits", {}).get("daily_limit_usd", 10.0)
@@ -71,13 +147,16 @@ async def lifespan(app: FastAPI):
         cost_tracker = CostTracker(daily_limit=daily_limit)
         activity_logger = ActivityLogger()
         health_checker = HealthChecker(cost_tracker, activity_logger)
+        cost_flush_task = asyncio.create_task(flush_costs_periodically())
 
         # Start the tweet scheduler for automatic posting
-        from app.scheduler import start_scheduler
-
         start_scheduler()
         logger.info("Tweet scheduler started - automatic posting enabled")
 
+        # SIGHUP re-reads .env and re-resolves account credentials
+        if hasattr(signal, "SIGHUP"):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_env)
+
         # Log startup
         activity_logger.log_system_event(
             "startup", "Application started successfully with automatic posting"
@@ -92,14 +171,26 @@ async def lifespan(app: FastAPI):
     finally:
         # Cleanup scheduler
         try:
-            from app.scheduler import stop_scheduler
-
             stop_scheduler()
             logger.info("Tweet scheduler stopped")
         except Exception as e:
             logger.error("Error stopping scheduler during cleanup", error=str(e))
 
-        # Cleanup monitoring
+        # Release the vector database client
+        try:
+            shutdown_vector_db()
+        except Exception as e:
+            logger.error("Error closing vector database during cleanup", error=str(e))
+
+        # Cleanup monitoring; buffered cost rows are written here rather than
+        # waiting for the atexit flush
+        if cost_flush_task:
+            cost_flush_task.cancel()
+        if cost_tracker:
+            try:
+                cost_tracker.flush()
+            except Exception as e:
+                logger.error("Error flushing cost records during cleanup", error=str(e))
         if activity_logger:
             activity_logger.log_system_event("shutdown", "Application shutting down")
         logger.info("Zen Kink Bot shutdown complete")
@@ -111,22 +202,140 @@ app = FastAPI(
     description="Autonomous Twitter bot blending Eckhart Tolle and Carolyn Elliott philosophies",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=_JSONResponse,
 )
 
-# Templates and static files
-templates = Jinja2Templates(directory="ui_templates")
+# Templates and static files. Templates only change on deploy, so compiled
+# templates are never re-checked against disk and their bytecode is kept
+# across restarts
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader("ui_templates"),
+        autoescape=jinja2.select_autoescape(),
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+    )
+)
+
+# HTML fragments returned to htmx. Anything with variable content is a Jinja
+# partial in ui_templates/partials, so it is compiled once and autoescaped
+_EMERGENCY_STOP_HTML = """
+<div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
+    <h4 class="font-medium text-red-800 mb-2">Cannot Post:</h4>
+    <p class="text-sm text-red-700">Emergency stop is active</p>
+</div>
+"""
+
+
+def _render_partial(name: str, **context: Any) -> str:
+    """Render a fragment from ui_templates/partials."""
+    return templates.get_template(f"partials/{name}").render(**context)
+
+
+def _search_message(message: str, color: str = "gray") -> str:
+    """Render a one-line status message for the knowledge base search panel."""
+    return _render_partial("search_message.html", message=message, color=color)
+
+
+def _generated_tweet_html(title: str, result: dict) -> str:
+    """Render a generated (and possibly posted) tweet with its stats."""
+    details = [
+        f"Length: {result.get('character_count', 0)}/280",
+        f"Source: {result.get('seed_source', 'Unknown')}",
+        f"Generation time: {result.get('generation_time_ms', 0)}ms",
+    ]
+    if result.get("was_shortened"):
+        details.append("Shortened")
+    if result.get("twitter_id"):
+        details.append(f"Twitter ID: {result['twitter_id']}")
+    return _render_partial(
+        "tweet_result.html",
+        title=title,
+        tweet_text=result.get("tweet_text", ""),
+        details=details,
+    )
+
+
+def _without_exemplar(exemplars: list, exemplar_id: int) -> Optional[list]:
+    """Return a new list without the exemplar with ``exemplar_id``.
+
+    Returns None when no exemplar has that ID, so callers can skip rewriting
+    a file that has not changed. The given list is left as it is.
+    """
+    remaining = [e for e in exemplars if e.get("id") != exemplar_id]
+    return remaining if len(remaining) != len(exemplars) else None
+
+
+def _next_exemplar_id(account: dict, exemplars: list) -> int:
+    """Return the next exemplar ID from the account's saved counter.
+
+    Accounts saved before the counter existed get it seeded from their
+    highest exemplar ID on first use. The counter is only advanced by the
+    caller's save, so a rejected save does not use up the ID.
+    """
+    next_id = account.get("next_exemplar_id")
+    if next_id is None:
+        next_id = max((e.get("id", 0) for e in exemplars), default=0) + 1
+    return next_id
+
 
-# Mount static files if directory exists
+async def _get_health_status() -> dict:
+    """Return the shallow health check, reusing one under a second old.
+
+    Concurrent callers wait on a single in-flight check rather than each
+    running their own.
+    """
+    global _health_cache
+
+    async with _health_lock:
+        if (
+            _health_cache is None
+            or time.monotonic() - _health_cache[0] >= _HEALTH_TTL_SECONDS
+        ):
+            health_status = await asyncio.to_thread(health_checker.check_health)
+            _health_cache = (time.monotonic(), health_status)
+        return _health_cache[1]
+
+
+class _CachedStaticFiles(StaticFiles):
+    """StaticFiles that stats each asset once instead of on every request.
+
+    Static assets only change on deploy, like the templates, so the resolved
+    path and ``os.stat`` result are kept for the life of the process.
+    Misses are not cached, so unknown paths cannot grow the cache.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._lookup_cache: Dict[str, Tuple[str, os.stat_result]] = {}
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        cached = self._lookup_cache.get(path)
+        if cached is not None:
+            return cached
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None:
+            self._lookup_cache[path] = (full_path, stat_result)
+        return full_path, stat_result
+
+
+# Mount static files if directory exists. Set SERVE_STATIC=0 when a reverse
+# proxy serves /static so asset requests never reach Python.
 static_dir = Path("ui_templates/static")
-if static_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+if os.getenv("SERVE_STATIC", "1") == "1" and static_dir.exists():
+    app.mount(
+        "/static",
+        _CachedStaticFiles(directory=str(static_dir), html=False),
+        name="static",
+    )
 
 
 @app.exception_handler(ZenKinkBotException)
 async def bot_exception_handler(request: Request, exc: ZenKinkBotException):
     """Handle custom bot exceptions."""
     logger.error("Bot exception occurred", exception=str(exc), path=request.url.path)
-    return JSONResponse(status_code=500, content={"error": f"Bot error: {str(exc)}"})
+    return _JSONResponse(status_code=500, content={"error": f"Bot error: {str(exc)}"})
 
 
 @app.exception_handler(Exception)
@@ -135,7 +344,7 @@ async def general_exception_handler(request: Request, exc: Exception):
     logger.error(
         "Unexpected exception occurred", exception=str(exc), path=request.url.path
     )
-    return JSONResponse(status_code=500, content={"error": "Internal server error"})
+    return _JSONResponse(status_code=500, content={"error": "Internal server error"})
 
 
 @app.get("/")
@@ -154,14 +363,16 @@ async def dashboard(request: Request, account_id: Optional[str] = None):
 
         account = accounts[account_id]
 
-        # Get system status
-        health_status = health_checker.check_health(deep=False)
-        recent_posts = activity_logger.get_recent_posts(
-            limit=5, account_filter=account_id
-        )
-        daily_cost = cost_tracker.get_daily_cost()
-        success_rate = activity_logger.get_success_rate(
-            hours=24, account_filter=account_id
+        # Get system status (independent SQLite reads, run side by side)
+        health_status, recent_posts, daily_cost, success_rate = await asyncio.gather(
+            _get_health_status(),
+            asyncio.to_thread(
+                activity_logger.get_recent_posts, limit=5, account_filter=account_id
+            ),
+            asyncio.to_thread(cost_tracker.get_daily_cost),
+            asyncio.to_thread(
+                activity_logger.get_success_rate, hours=24, account_filter=account_id
+            ),
         )
 
         # Get account-specific data
@@ -169,8 +380,6 @@ async def dashboard(request: Request, account_id: Optional[str] = None):
         exemplars = account.get("exemplars", [])
 
         # Get scheduler status
-        from app.scheduler import get_scheduler_status
-
         scheduler_status = get_scheduler_status()
 
         context = {
@@ -185,7 +394,7 @@ async def dashboard(request: Request, account_id: Optional[str] = None):
             "success_rate": success_rate,
             "persona": persona,
             "exemplars": exemplars,
-            "emergency_stop": emergency_stop,
+            "emergency_stop": emergency_stop_event.is_set(),
             "scheduler": scheduler_status,
         }
 
@@ -200,12 +409,12 @@ async def dashboard(request: Request, account_id: Optional[str] = None):
 async def health_check():
     """Basic health check endpoint."""
     try:
-        health_status = health_checker.check_health(deep=False)
+        health_status = await _get_health_status()
         status_code = 200 if health_status["status"] == "healthy" else 503
-        return JSONResponse(content=health_status, status_code=status_code)
+        return _JSONResponse(content=health_status, status_code=status_code)
     except Exception as e:
         logger.error("Health check failed", error=str(e))
-        return JSONResponse(
+        return _JSONResponse(
             content={"status": "unhealthy", "error": str(e)}, status_code=503
         )
 
@@ -216,10 +425,10 @@ async def deep_health_check():
     try:
         health_status = health_checker.check_health(deep=True)
         status_code = 200 if health_status["status"] == "healthy" else 503
-        return JSONResponse(content=health_status, status_code=status_code)
+        return _JSONResponse(content=health_status, status_code=status_code)
     except Exception as e:
         logger.error("Deep health check failed", error=str(e))
-        return JSONResponse(
+        return _JSONResponse(
             content={"status": "unhealthy", "error": str(e)}, status_code=503
         )
 
@@ -227,8 +436,11 @@ async def deep_health_check():
 @app.post("/emergency-stop")
 async def emergency_stop_toggle():
     """Toggle emergency stop state."""
-    global emergency_stop
-    emergency_stop = not emergency_stop
+    if emergency_stop_event.is_set():
+        emergency_stop_event.clear()
+    else:
+        emergency_stop_event.set()
+    emergency_stop = emergency_stop_event.is_set()
 
     status = "activated" if emergency_stop else "deactivated"
     activity_logger.log_system_event(
@@ -246,24 +458,26 @@ async def emergency_stop_toggle():
 async def get_status():
     """Get current system status as JSON."""
     try:
-        health_status = health_checker.check_health(deep=False)
-        recent_posts = activity_logger.get_recent_posts(limit=1)
+        health_status, recent_posts, daily_cost, success_rate = await asyncio.gather(
+            _get_health_status(),
+            asyncio.to_thread(activity_logger.get_recent_posts, limit=1),
+            asyncio.to_thread(cost_tracker.get_daily_cost),
+            asyncio.to_thread(activity_logger.get_success_rate, hours=24),
+        )
 
         # Get scheduler status
-        from app.scheduler import get_scheduler_status
-
         scheduler_status = get_scheduler_status()
 
         last_post = recent_posts[0] if recent_posts else None
 
         return {
-            "status": "active" if not emergency_stop else "stopped",
+            "status": "stopped" if emergency_stop_event.is_set() else "active",
             "health": health_status["status"],
             "last_post": last_post,
-            "emergency_stop": emergency_stop,
-            "daily_cost": cost_tracker.get_daily_cost(),
+            "emergency_stop": emergency_stop_event.is_set(),
+            "daily_cost": daily_cost,
             "cost_limit": cost_tracker.daily_limit,
-            "success_rate": activity_logger.get_success_rate(hours=24),
+            "success_rate": success_rate,
             "scheduler": scheduler_status,
         }
     except Exception as e:
@@ -274,55 +488,27 @@ async def get_status():
 @app.post("/api/force-post")
 async def force_post():
     """Force generate and post a tweet immediately."""
-    if emergency_stop:
-        return HTMLResponse(
-            """
-        <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-            <h4 class="font-medium text-red-800 mb-2">Cannot Post:</h4>
-            <p class="text-sm text-red-700">Emergency stop is active</p>
-        </div>
-        """
-        )
+    if emergency_stop_event.is_set():
+        return HTMLResponse(_EMERGENCY_STOP_HTML)
 
     try:
-        # Import here to avoid circular imports
-        from app.generation import generate_and_post_tweet
-
         logger.info("Starting forced tweet generation and posting")
         result = await generate_and_post_tweet()
 
         if result.get("status") == "success":
-            html = f"""
-            <div class="mt-4 p-4 bg-green-50 border border-green-200 rounded">
-                <h4 class="font-medium text-green-800 mb-2">Tweet Posted Successfully!</h4>
-                <p class="text-sm bg-white p-3 rounded border">{result.get('tweet_text', '')}</p>
-                <div class="mt-2 text-xs text-green-600">
-                    Length: {result.get('character_count', 0)}/280 • 
-                    Source: {result.get('seed_source', 'Unknown')} • 
-                    Generation time: {result.get('generation_time_ms', 0)}ms
-                    {' • Shortened' if result.get('was_shortened') else ''}
-                    {f' • Twitter ID: {result.get("twitter_id")}' if result.get('twitter_id') else ''}
-                </div>
-            </div>
-            """
+            html = _generated_tweet_html("Tweet Posted Successfully!", result)
         else:
-            html = f"""
-            <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-                <h4 class="font-medium text-red-800 mb-2">Post Failed:</h4>
-                <p class="text-sm text-red-700">{result.get('error', 'Unknown error')}</p>
-            </div>
-            """
+            html = _render_partial(
+                "error.html",
+                title="Post Failed:",
+                message=result.get("error", "Unknown error"),
+            )
 
         return HTMLResponse(html)
 
     except Exception as e:
         logger.error("Force post failed", error=str(e))
-        html = f"""
-        <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-            <h4 class="font-medium text-red-800 mb-2">Force Post Failed:</h4>
-            <p class="text-sm text-red-700">{str(e)}</p>
-        </div>
-        """
+        html = _render_partial("error.html", title="Force Post Failed:", message=str(e))
         return HTMLResponse(html)
 
 
@@ -366,8 +552,6 @@ async def update_persona(request: Request):
             raise HTTPException(status_code=400, detail="Persona cannot be empty")
 
         # Validate content
-        from app.security import validate_user_input
-
         if not validate_user_input(new_persona, "persona"):
             raise HTTPException(
                 status_code=400, detail="Persona contains inappropriate content"
@@ -375,7 +559,7 @@ async def update_persona(request: Request):
 
         # Save to file
         persona_path = Path("data/persona.txt")
-        persona_path.write_text(new_persona)
+        await asyncio.to_thread(persona_path.write_text, new_persona)
 
         logger.info("Global persona updated", length=len(new_persona))
         activity_logger.log_system_event("persona_updated", "User updated bot persona")
@@ -409,21 +593,19 @@ async def update_account_persona(account_id: str, request: Request):
             raise HTTPException(status_code=400, detail="Persona cannot be empty")
 
         # Validate content
-        from app.security import validate_user_input
-
         if not validate_user_input(new_persona, "persona"):
             raise HTTPException(
                 status_code=400, detail="Persona contains inappropriate content"
             )
 
-        # Update account configuration
-        account["persona"] = new_persona
+        # Update a copy; the cached account only changes through save_account
+        updated_account = {**account, "persona": new_persona}
 
         # Save account configuration
-        from app.account_manager import get_account_manager
-
         account_manager = get_account_manager()
-        success = account_manager.save_account(account)
+        success = await asyncio.to_thread(
+            account_manager.save_account, updated_account
+        )
 
         if not success:
             raise HTTPException(
@@ -461,37 +643,32 @@ async def add_exemplar(request: Request):
             raise HTTPException(status_code=400, detail="Tweet text cannot be empty")
 
         # Validate content
-        from app.security import validate_user_input
-
         if not validate_user_input(tweet_text, "exemplar"):
             raise HTTPException(
                 status_code=400, detail="Tweet contains inappropriate content"
             )
 
         # Load existing exemplars
-        import json
-
         exemplars_path = Path("data/exemplars.json")
 
-        if exemplars_path.exists():
-            with open(exemplars_path) as f:
-                exemplars = json.load(f)
-        else:
-            exemplars = []
-
-        # Add new exemplar
-        new_id = max([e.get("id", 0) for e in exemplars], default=0) + 1
-        new_exemplar = {
-            "id": new_id,
-            "text": tweet_text,
-            "created_at": datetime.now().isoformat(),
-        }
+        async with _exemplars_lock:
+            if exemplars_path.exists():
+                exemplars = await asyncio.to_thread(read_json_file, exemplars_path)
+            else:
+                exemplars = []
+
+            # Add new exemplar
+            new_id = max((e.get("id", 0) for e in exemplars), default=0) + 1
+            new_exemplar = {
+                "id": new_id,
+                "text": tweet_text,
+                "created_at": datetime.now().isoformat(),
+            }
 
-        exemplars.append(new_exemplar)
+            exemplars.append(new_exemplar)
 
-        # Save back to file
-        with open(exemplars_path, "w") as f:
-            json.dump(exemplars, f, indent=2)
+            # Save back to file
+            await asyncio.to_thread(write_json_file, exemplars_path, exemplars)
 
         logger.info("Global exemplar added", id=new_id, text=tweet_text[:50])
         activity_logger.log_system_event(
@@ -499,21 +676,11 @@ async def add_exemplar(request: Request):
         )
 
         return HTMLResponse(
-            f"""
-        <div class="flex items-start justify-between p-3 bg-gray-50 rounded border">
-            <div class="flex-1">
-                <p class="text-sm">{tweet_text}</p>
-            </div>
-            <button 
-                hx-delete="/api/exemplars/{new_id}"
-                hx-target="closest div"
-                hx-swap="outerHTML"
-                hx-confirm="Delete this exemplar?"
-                class="ml-2 text-red-500 hover:text-red-700">
-                ×
-            </button>
-        </div>
-        """
+            _render_partial(
+                "exemplar_item.html",
+                delete_url=f"/api/exemplars/{new_id}",
+                tweet_text=tweet_text,
+            )
         )
 
     except HTTPException:
@@ -541,8 +708,6 @@ async def add_account_exemplar(account_id: str, request: Request):
             raise HTTPException(status_code=400, detail="Tweet text cannot be empty")
 
         # Validate content
-        from app.security import validate_user_input
-
         if not validate_user_input(tweet_text, "exemplar"):
             raise HTTPException(
                 status_code=400, detail="Tweet contains inappropriate content"
@@ -552,21 +717,25 @@ async def add_account_exemplar(account_id: str, request: Request):
         exemplars = account.get("exemplars", [])
 
         # Add new exemplar
-        new_id = max([e.get("id", 0) for e in exemplars], default=0) + 1
+        new_id = _next_exemplar_id(account, exemplars)
         new_exemplar = {
             "id": new_id,
             "text": tweet_text,
             "created_at": datetime.now().isoformat(),
         }
 
-        exemplars.append(new_exemplar)
-        account["exemplars"] = exemplars
+        # The cache only changes through a successful save_account
+        updated_account = {
+            **account,
+            "exemplars": [*exemplars, new_exemplar],
+            "next_exemplar_id": new_id + 1,
+        }
 
         # Save account configuration
-        from app.account_manager import get_account_manager
-
         account_manager = get_account_manager()
-        success = account_manager.save_account(account)
+        success = await asyncio.to_thread(
+            account_manager.save_account, updated_account
+        )
 
         if not success:
             raise HTTPException(
@@ -584,21 +753,11 @@ async def add_account_exemplar(account_id: str, request: Request):
         )
 
         return HTMLResponse(
-            f"""
-        <div class="flex items-start justify-between p-3 bg-gray-50 rounded border">
-            <div class="flex-1">
-                <p class="text-sm">{tweet_text}</p>
-            </div>
-            <button 
-                hx-delete="/api/exemplars/{account_id}/{new_id}"
-                hx-target="closest div"
-                hx-swap="outerHTML"
-                hx-confirm="Delete this exemplar?"
-                class="ml-2 text-red-500 hover:text-red-700">
-                ×
-            </button>
-        </div>
-        """
+            _render_partial(
+                "exemplar_item.html",
+                delete_url=f"/api/exemplars/{account_id}/{new_id}",
+                tweet_text=tweet_text,
+            )
         )
 
     except HTTPException:
@@ -614,22 +773,18 @@ async def add_account_exemplar(account_id: str, request: Request):
 async def delete_exemplar(exemplar_id: int):
     """Delete an exemplar tweet (global fallback)."""
     try:
-        import json
-
         exemplars_path = Path("data/exemplars.json")
 
         if not exemplars_path.exists():
             raise HTTPException(status_code=404, detail="No exemplars found")
 
-        with open(exemplars_path) as f:
-            exemplars = json.load(f)
-
-        # Remove exemplar with matching ID
-        exemplars = [e for e in exemplars if e.get("id") != exemplar_id]
+        async with _exemplars_lock:
+            exemplars = await asyncio.to_thread(read_json_file, exemplars_path)
 
-        # Save back to file
-        with open(exemplars_path, "w") as f:
-            json.dump(exemplars, f, indent=2)
+            # Remove exemplar with matching ID; nothing to save if it is gone
+            remaining = _without_exemplar(exemplars, exemplar_id)
+            if remaining is not None:
+                await asyncio.to_thread(write_json_file, exemplars_path, remaining)
 
         logger.info("Global exemplar deleted", id=exemplar_id)
         activity_logger.log_system_event(
@@ -658,24 +813,21 @@ async def delete_account_exemplar(account_id: str, exemplar_id: int):
                 status_code=404, detail=f"Account {account_id} not found"
             )
 
-        # Get existing exemplars from account
-        exemplars = account.get("exemplars", [])
-
-        # Remove exemplar with matching ID
-        exemplars = [e for e in exemplars if e.get("id") != exemplar_id]
-        account["exemplars"] = exemplars
-
-        # Save account configuration
-        from app.account_manager import get_account_manager
-
-        account_manager = get_account_manager()
-        success = account_manager.save_account(account)
-
-        if not success:
-            raise HTTPException(
-                status_code=500, detail="Failed to save account configuration"
+        # Remove exemplar with matching ID; nothing to save if it is gone
+        remaining = _without_exemplar(account.get("exemplars", []), exemplar_id)
+        if remaining is not None:
+            # The cache only changes through a successful save_account
+            updated_account = {**account, "exemplars": remaining}
+            account_manager = get_account_manager()
+            success = await asyncio.to_thread(
+                account_manager.save_account, updated_account
             )
 
+            if not success:
+                raise HTTPException(
+                    status_code=500, detail="Failed to save account configuration"
+                )
+
         logger.info("Account exemplar deleted", account_id=account_id, id=exemplar_id)
         activity_logger.log_system_event(
             "exemplar_deleted", f"Deleted exemplar ID {exemplar_id} from {account_id}"
@@ -698,108 +850,67 @@ async def delete_account_exemplar(account_id: str, exemplar_id: int):
 
 
 @app.get("/api/search-chunks")
-async def search_chunks(query: str, limit: int = 10):
+async def search_chunks(
+    query: str = Query(max_length=_SEARCH_QUERY_MAX_LENGTH),
+    limit: int = Query(default=10, ge=1, le=_SEARCH_LIMIT_MAX),
+):
     """Search knowledge base chunks."""
     try:
-        from app.vector_search import search_knowledge_base
-
         if not query.strip():
             return HTMLResponse(
-                "<p class='text-gray-500 text-sm'>Enter a search term to explore the knowledge base</p>"
+                _search_message("Enter a search term to explore the knowledge base")
             )
 
-        results = search_knowledge_base(query, limit=limit)
+        results = await asyncio.to_thread(search_knowledge_base, query, limit=limit)
 
         if not results:
-            return HTMLResponse("<p class='text-gray-500 text-sm'>No results found</p>")
-
-        # Build HTML response
-        html_parts = []
-        for result in results:
-            html_parts.append(
-                f"""
-            <div class="p-3 bg-gray-50 rounded border">
-                <div class="flex justify-between items-start mb-2">
-                    <span class="text-xs text-gray-500">{result['source_title']} - Chunk {result['chunk_index']}</span>
-                    <span class="text-xs text-blue-600">Similarity: {result['similarity']}</span>
-                </div>
-                <p class="text-sm whitespace-pre-wrap">{result['full_text']}</p>
-                <div class="text-xs text-gray-400 mt-1">{result['word_count']} words</div>
-            </div>
-            """
-            )
+            return HTMLResponse(_search_message("No results found"))
 
-        return HTMLResponse("\n".join(html_parts))
+        return HTMLResponse(_render_partial("search_results.html", results=results))
 
     except Exception as e:
         logger.error("Chunk search failed", query=query, error=str(e))
-        return HTMLResponse(
-            f"<p class='text-red-500 text-sm'>Search failed: {str(e)}</p>"
-        )
+        return HTMLResponse(_search_message(f"Search failed: {str(e)}", "red"))
 
 
 @app.post("/api/test-generation")
-async def test_generation(request: Request):
+async def test_generation(persona: Optional[str] = Form(default=None)):
     """Generate a test tweet without posting."""
     try:
-        form = await request.form()
-        custom_persona = form.get("persona")
-
-        from app.generation import generate_test_tweet
-
-        result = await generate_test_tweet(
-            custom_persona=custom_persona if custom_persona else None
-        )
+        result = await generate_test_tweet(custom_persona=persona if persona else None)
 
         if result["status"] == "success" and result.get("tweet_text"):
-            html = f"""
-            <div class="mt-4 p-4 bg-green-50 border border-green-200 rounded">
-                <h4 class="font-medium text-green-800 mb-2">Test Tweet Generated:</h4>
-                <p class="text-sm bg-white p-3 rounded border">{result['tweet_text']}</p>
-                <div class="mt-2 text-xs text-green-600">
-                    Length: {result['character_count']}/280 • 
-                    Source: {result['seed_source']} • 
-                    Generation time: {result['generation_time_ms']}ms
-                    {' • Shortened' if result.get('was_shortened') else ''}
-                </div>
-            </div>
-            """
+            html = _generated_tweet_html("Test Tweet Generated:", result)
         elif result["status"] == "success" and not result.get("tweet_text"):
-            html = f"""
-            <div class="mt-4 p-4 bg-yellow-50 border border-yellow-200 rounded">
-                <h4 class="font-medium text-yellow-800 mb-2">Empty Tweet Generated:</h4>
-                <p class="text-sm text-yellow-700">Tweet generation completed but returned empty text. Check model configuration and prompts.</p>
-                <div class="mt-2 text-xs text-yellow-600">
-                    Source: {result.get('seed_source', 'Unknown')} • 
-                    Generation time: {result.get('generation_time_ms', 0)}ms
-                </div>
-            </div>
-            """
+            html = _render_partial(
+                "empty_tweet.html",
+                title="Empty Tweet Generated:",
+                seed_source=result.get("seed_source", "Unknown"),
+                generation_time_ms=result.get("generation_time_ms", 0),
+            )
         else:
-            html = f"""
-            <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-                <h4 class="font-medium text-red-800 mb-2">Generation Failed:</h4>
-                <p class="text-sm text-red-700">{result.get('error', 'Unknown error')}</p>
-            </div>
-            """
+            html = _render_partial(
+                "error.html",
+                title="Generation Failed:",
+                message=result.get("error", "Unknown error"),
+            )
 
         return HTMLResponse(html)
 
     except Exception as e:
         logger.error("Test generation failed", error=str(e))
-        html = f"""
-        <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-            <h4 class="font-medium text-red-800 mb-2">Test Failed:</h4>
-            <p class="text-sm text-red-700">{str(e)}</p>
-        </div>
-        """
+        html = _render_partial("error.html", title="Test Failed:", message=str(e))
         return HTMLResponse(html)
 
 
 # Multi-account API endpoints
 @app.get("/api/accounts")
-async def get_accounts():
-    """Get list of all accounts."""
+async def get_accounts(request: Request):
+    """Get list of all accounts.
+
+    The list rarely changes and the dashboard polls it, so it carries an ETag
+    and a short max-age; a matching If-None-Match gets an empty 304.
+    """
     try:
         accounts = load_all_accounts()
         account_list = []
@@ -813,7 +924,16 @@ async def get_accounts():
             }
             account_list.append(account_info)
 
-        return {"accounts": account_list}
+        response = _JSONResponse({"accounts": account_list})
+        etag = f'"{hashlib.md5(response.body, usedforsecurity=False).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": "max-age=5"}
+
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+        return response
     except Exception as e:
         logger.error("Get accounts API error", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -830,14 +950,15 @@ async def get_account_status(account_id: str):
                 status_code=404, detail=f"Account {account_id} not found"
             )
 
-        health_status = health_checker.check_health(deep=False)
-        recent_posts = activity_logger.get_recent_posts(
-            limit=5, account_filter=account_id
+        health_status, recent_posts, success_rate = await asyncio.gather(
+            _get_health_status(),
+            asyncio.to_thread(
+                activity_logger.get_recent_posts, limit=5, account_filter=account_id
+            ),
+            asyncio.to_thread(activity_logger.get_success_rate, hours=24),
         )
 
         # Get scheduler status
-        from app.scheduler import get_scheduler_status
-
         scheduler_status = get_scheduler_status()
 
         last_post = recent_posts[0] if recent_posts else None
@@ -845,12 +966,12 @@ async def get_account_status(account_id: str):
         return {
             "account_id": account_id,
             "display_name": account.get("display_name", account_id),
-            "status": "active" if not emergency_stop else "stopped",
+            "status": "stopped" if emergency_stop_event.is_set() else "active",
             "health": health_status["status"],
             "last_post": last_post,
             "recent_posts": recent_posts,
-            "emergency_stop": emergency_stop,
-            "success_rate": activity_logger.get_success_rate(hours=24),
+            "emergency_stop": emergency_stop_event.is_set(),
+            "success_rate": success_rate,
             "scheduler": scheduler_status,
             "vector_collection": account.get("vector_collection"),
         }
@@ -872,45 +993,30 @@ async def force_post_account(account_id: str):
                 status_code=404, detail=f"Account {account_id} not found"
             )
 
-        if emergency_stop:
+        if emergency_stop_event.is_set():
             return HTMLResponse(
-                f"""
-            <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-                <h4 class="font-medium text-red-800 mb-2">Cannot Post for {account_id}:</h4>
-                <p class="text-sm text-red-700">Emergency stop is active</p>
-            </div>
-            """
+                _render_partial(
+                    "error.html",
+                    title=f"Cannot Post for {account_id}:",
+                    message="Emergency stop is active",
+                )
             )
 
-        # Import here to avoid circular imports
-        from app.generation import generate_and_post_tweet
-
         logger.info(
             "Starting forced tweet generation and posting", account_id=account_id
         )
         result = await generate_and_post_tweet(account_id=account_id)
 
         if result.get("status") == "success":
-            html = f"""
-            <div class="mt-4 p-4 bg-green-50 border border-green-200 rounded">
-                <h4 class="font-medium text-green-800 mb-2">Tweet Posted Successfully for {account_id}!</h4>
-                <p class="text-sm bg-white p-3 rounded border">{result.get('tweet_text', '')}</p>
-                <div class="mt-2 text-xs text-green-600">
-                    Length: {result.get('character_count', 0)}/280 • 
-                    Source: {result.get('seed_source', 'Unknown')} • 
-                    Generation time: {result.get('generation_time_ms', 0)}ms
-                    {' • Shortened' if result.get('was_shortened') else ''}
-                    {f' • Twitter ID: {result.get("twitter_id")}' if result.get('twitter_id') else ''}
-                </div>
-            </div>
-            """
+            html = _generated_tweet_html(
+                f"Tweet Posted Successfully for {account_id}!", result
+            )
         else:
-            html = f"""
-            <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-                <h4 class="font-medium text-red-800 mb-2">Post Failed for {account_id}:</h4>
-                <p class="text-sm text-red-700">{result.get('error', 'Unknown error')}</p>
-            </div>
-            """
+            html = _render_partial(
+                "error.html",
+                title=f"Post Failed for {account_id}:",
+                message=result.get("error", "Unknown error"),
+            )
 
         return HTMLResponse(html)
 
@@ -918,17 +1024,16 @@ async def force_post_account(account_id: str):
         raise
     except Exception as e:
         logger.error("Force post failed", account_id=account_id, error=str(e))
-        html = f"""
-        <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-            <h4 class="font-medium text-red-800 mb-2">Force Post Failed for {account_id}:</h4>
-            <p class="text-sm text-red-700">{str(e)}</p>
-        </div>
-        """
+        html = _render_partial(
+            "error.html", title=f"Force Post Failed for {account_id}:", message=str(e)
+        )
         return HTMLResponse(html)
 
 
 @app.post("/api/test-generation/{account_id}")
-async def test_generation_account(account_id: str, request: Request):
+async def test_generation_account(
+    account_id: str, persona: Optional[str] = Form(default=None)
+):
     """Generate a test tweet for a specific account without posting."""
     try:
         # Verify account exists
@@ -938,47 +1043,28 @@ async def test_generation_account(account_id: str, request: Request):
                 status_code=404, detail=f"Account {account_id} not found"
             )
 
-        form = await request.form()
-        custom_persona = form.get("persona")
-
-        from app.generation import generate_test_tweet
-
         result = await generate_test_tweet(
-            custom_persona=custom_persona if custom_persona else None,
+            custom_persona=persona if persona else None,
             account_id=account_id,
         )
 
         if result["status"] == "success" and result.get("tweet_text"):
-            html = f"""
-            <div class="mt-4 p-4 bg-green-50 border border-green-200 rounded">
-                <h4 class="font-medium text-green-800 mb-2">Test Tweet Generated for {account_id}:</h4>
-                <p class="text-sm bg-white p-3 rounded border">{result['tweet_text']}</p>
-                <div class="mt-2 text-xs text-green-600">
-                    Length: {result['character_count']}/280 • 
-                    Source: {result['seed_source']} • 
-                    Generation time: {result['generation_time_ms']}ms
-                    {' • Shortened' if result.get('was_shortened') else ''}
-                </div>
-            </div>
-            """
+            html = _generated_tweet_html(
+                f"Test Tweet Generated for {account_id}:", result
+            )
         elif result["status"] == "success" and not result.get("tweet_text"):
-            html = f"""
-            <div class="mt-4 p-4 bg-yellow-50 border border-yellow-200 rounded">
-                <h4 class="font-medium text-yellow-800 mb-2">Empty Tweet Generated for {account_id}:</h4>
-                <p class="text-sm text-yellow-700">Tweet generation completed but returned empty text. Check model configuration and prompts.</p>
-                <div class="mt-2 text-xs text-yellow-600">
-                    Source: {result.get('seed_source', 'Unknown')} • 
-                    Generation time: {result.get('generation_time_ms', 0)}ms
-                </div>
-            </div>
-            """
+            html = _render_partial(
+                "empty_tweet.html",
+                title=f"Empty Tweet Generated for {account_id}:",
+                seed_source=result.get("seed_source", "Unknown"),
+                generation_time_ms=result.get("generation_time_ms", 0),
+            )
         else:
-            html = f"""
-            <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-                <h4 class="font-medium text-red-800 mb-2">Generation Failed for {account_id}:</h4>
-                <p class="text-sm text-red-700">{result.get('error', 'Unknown error')}</p>
-            </div>
-            """
+            html = _render_partial(
+                "error.html",
+                title=f"Generation Failed for {account_id}:",
+                message=result.get("error", "Unknown error"),
+            )
 
         return HTMLResponse(html)
 
@@ -986,17 +1072,18 @@ async def test_generation_account(account_id: str, request: Request):
         raise
     except Exception as e:
         logger.error("Test generation failed", account_id=account_id, error=str(e))
-        html = f"""
-        <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-            <h4 class="font-medium text-red-800 mb-2">Test Failed for {account_id}:</h4>
-            <p class="text-sm text-red-700">{str(e)}</p>
-        </div>
-        """
+        html = _render_partial(
+            "error.html", title=f"Test Failed for {account_id}:", message=str(e)
+        )
         return HTMLResponse(html)
 
 
 @app.get("/api/search-chunks/{account_id}")
-async def search_chunks_account(account_id: str, query: str, limit: int = 10):
+async def search_chunks_account(
+    account_id: str,
+    query: str = Query(max_length=_SEARCH_QUERY_MAX_LENGTH),
+    limit: int = Query(default=10, ge=1, le=_SEARCH_LIMIT_MAX),
+):
     """Search knowledge base chunks for a specific account."""
     try:
         # Verify account exists
@@ -1006,37 +1093,21 @@ async def search_chunks_account(account_id: str, query: str, limit: int = 10):
                 status_code=404, detail=f"Account {account_id} not found"
             )
 
-        from app.vector_search import search_knowledge_base
-
         if not query.strip():
             return HTMLResponse(
-                f"<p class='text-gray-500 text-sm'>Enter a search term to explore the knowledge base for {account_id}</p>"
+                _search_message(
+                    f"Enter a search term to explore the knowledge base for {account_id}"
+                )
             )
 
-        results = search_knowledge_base(query, limit=limit, account_id=account_id)
+        results = await asyncio.to_thread(
+            search_knowledge_base, query, limit=limit, account_id=account_id
+        )
 
         if not results:
-            return HTMLResponse(
-                f"<p class='text-gray-500 text-sm'>No results found for {account_id}</p>"
-            )
-
-        # Build HTML response
-        html_parts = []
-        for result in results:
-            html_parts.append(
-                f"""
-            <div class="p-3 bg-gray-50 rounded border">
-                <div class="flex justify-between items-start mb-2">
-                    <span class="text-xs text-gray-500">{result['source_title']} - Chunk {result['chunk_index']}</span>
-                    <span class="text-xs text-blue-600">Similarity: {result['similarity']}</span>
-                </div>
-                <p class="text-sm whitespace-pre-wrap">{result['full_text']}</p>
-                <div class="text-xs text-gray-400 mt-1">{result['word_count']} words</div>
-            </div>
-            """
-            )
+            return HTMLResponse(_search_message(f"No results found for {account_id}"))
 
-        return HTMLResponse("\n".join(html_parts))
+        return HTMLResponse(_render_partial("search_results.html", results=results))
 
     except HTTPException:
         raise
@@ -1045,7 +1116,7 @@ async def search_chunks_account(account_id: str, query: str, limit: int = 10):
             "Chunk search failed", account_id=account_id, query=query, error=str(e)
         )
         return HTMLResponse(
-            f"<p class='text-red-500 text-sm'>Search failed for {account_id}: {str(e)}</p>"
+            _search_message(f"Search failed for {account_id}: {str(e)}", "red")
         )
 
 
@@ -1053,8 +1124,6 @@ async def search_chunks_account(account_id: str, query: str, limit: int = 10):
 async def resume_scheduler():
     """Resume the scheduler if it's paused."""
     try:
-        from app.scheduler import get_scheduler
-
         scheduler = get_scheduler()
         scheduler.resume()
 
@@ -1071,8 +1140,6 @@ async def resume_scheduler():
 async def pause_scheduler():
     """Pause the scheduler."""
     try:
-        from app.scheduler import get_scheduler
-
         scheduler = get_scheduler()
         scheduler.pause()
 
@@ -1089,11 +1156,11 @@ async def pause_scheduler():
 async def restart_scheduler():
     """Restart the scheduler completely."""
     try:
-        from app.scheduler import start_scheduler, stop_scheduler
-
         logger.info("Restarting scheduler via API")
+        # Shutdown is synchronous: by the time stop_scheduler returns the
+        # old scheduler is no longer running and its pending jobs are
+        # cancelled, so the replacement can start straight away
         stop_scheduler()
-        await asyncio.sleep(2)  # Give it time to stop
         start_scheduler()
 
         return {"success": True, "message": "Scheduler restarted"}
@@ -1115,9 +1182,16 @@ async def get_platform_info_api(account_id: str):
                 status_code=404, detail=f"Account {account_id} not found"
             )
 
-        from app.multi_platform_poster import get_platform_info
+        cached = _platform_info_cache.get(account_id)
+        if cached is not None and (
+            time.monotonic() - cached[0] < _PLATFORM_INFO_TTL_SECONDS
+        ):
+            return cached[1]
 
-        platform_info = get_platform_info(account_id=account_id)
+        # Each platform is asked for its profile over the network
+        platform_info = await asyncio.to_thread(get_platform_info, account_id)
+        if platform_info.get("status") != "error":
+            _platform_info_cache[account_id] = (time.monotonic(), platform_info)
 
         return platform_info
     except HTTPException:
@@ -1138,9 +1212,9 @@ async def test_platform_connections(account_id: str):
                 status_code=404, detail=f"Account {account_id} not found"
             )
 
-        from app.multi_platform_poster import test_all_platform_connections
-
-        connection_results = test_all_platform_connections(account_id=account_id)
+        connection_results = await asyncio.to_thread(
+            test_all_platform_connections, account_id
+        )
 
         return connection_results
     except HTTPException:
@@ -1169,57 +1243,52 @@ async def force_post_single_platform(account_id: str, platform: str):
                 detail=f"Platform {platform} not enabled for account {account_id}",
             )
 
-        if emergency_stop:
+        if emergency_stop_event.is_set():
             return HTMLResponse(
-                f"""
-            <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-                <h4 class="font-medium text-red-800 mb-2">Cannot Post to {platform.title()} for {account_id}:</h4>
-                <p class="text-sm text-red-700">Emergency stop is active</p>
-            </div>
-            """
+                _render_partial(
+                    "error.html",
+                    title=f"Cannot Post to {platform.title()} for {account_id}:",
+                    message="Emergency stop is active",
+                )
             )
 
         # Generate content first
-        from app.generation import TweetGenerator
-        from app.security import ContentFilter
-
-        generator = TweetGenerator(account_id=account_id)
-        generation_result = generator.generate_tweet()
-
-        # Filter content
-        content_filter = ContentFilter()
-        if not content_filter.is_content_safe(generation_result["tweet_text"]):
+        generator = get_generator(account_id)
+        generation_result = await generator.generate_tweet()
+
+        # Filter content (the moderation call is blocking, so run it off the loop)
+        content_filter = get_content_filter()
+        if not await asyncio.to_thread(
+            content_filter.is_content_safe, generation_result.tweet_text
+        ):
             raise HTTPException(
                 status_code=400, detail="Generated content failed safety filters"
             )
 
         # Post to specific platform
-        from app.multi_platform_poster import MultiPlatformPoster
-
         multi_poster = MultiPlatformPoster(account_id=account_id)
         result = await multi_poster.post_to_platform(
-            platform, generation_result["tweet_text"]
+            platform, generation_result.tweet_text
         )
 
         if result.get("status") in ["posted", "simulated"]:
-            html = f"""
-            <div class="mt-4 p-4 bg-green-50 border border-green-200 rounded">
-                <h4 class="font-medium text-green-800 mb-2">{platform.title()} Post Successful for {account_id}!</h4>
-                <p class="text-sm bg-white p-3 rounded border">{generation_result.get('tweet_text', '')}</p>
-                <div class="mt-2 text-xs text-green-600">
-                    Platform: {platform.title()} • 
-                    Length: {generation_result.get('character_count', 0)} chars • 
-                    {f'Post ID: {result.get("post_id")}' if result.get('post_id') else 'Simulated'}
-                </div>
-            </div>
-            """
+            post_id = result.get("post_id")
+            html = _render_partial(
+                "tweet_result.html",
+                title=f"{platform.title()} Post Successful for {account_id}!",
+                tweet_text=generation_result.tweet_text,
+                details=[
+                    f"Platform: {platform.title()}",
+                    f"Length: {generation_result.character_count} chars",
+                    f"Post ID: {post_id}" if post_id else "Simulated",
+                ],
+            )
         else:
-            html = f"""
-            <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-                <h4 class="font-medium text-red-800 mb-2">{platform.title()} Post Failed for {account_id}:</h4>
-                <p class="text-sm text-red-700">{result.get('error', 'Unknown error')}</p>
-            </div>
-            """
+            html = _render_partial(
+                "error.html",
+                title=f"{platform.title()} Post Failed for {account_id}:",
+                message=result.get("error", "Unknown error"),
+            )
 
         return HTMLResponse(html)
 
@@ -1232,16 +1301,24 @@ async def force_post_single_platform(account_id: str, platform: str):
             platform=platform,
             error=str(e),
         )
-        html = f"""
-        <div class="mt-4 p-4 bg-red-50 border border-red-200 rounded">
-            <h4 class="font-medium text-red-800 mb-2">{platform.title()} Post Failed for {account_id}:</h4>
-            <p class="text-sm text-red-700">{str(e)}</p>
-        </div>
-        """
+        html = _render_partial(
+            "error.html",
+            title=f"{platform.title()} Post Failed for {account_id}:",
+            message=str(e),
+        )
         return HTMLResponse(html)
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # A single worker: the scheduler, emergency stop and caches live in this
+    # process, so extra workers would each post on their own schedule
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        access_log=os.getenv("ACCESS_LOG", "").lower() in ("1", "true", "yes"),
+    )
@@ -31,8 +31,11 @@ The monitoring system enables operators to:
 - Generate reports for optimization
 """
 
+import asyncio
+import atexit
 import json
 import sqlite3
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -40,18 +43,32 @@ from typing import Dict, List, Optional
 
 import structlog
 
-# Configure structured logging
+try:
+    import orjson
+
+    def _log_serializer(event_dict: Dict, **dumps_kw) -> str:
+        # orjson returns bytes; the stdlib logger it is handed to expects str
+        return orjson.dumps(
+            event_dict,
+            default=dumps_kw.get("default"),
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+except ImportError:
+    _log_serializer = json.dumps
+
+# Configure structured logging. Every enabled event runs the whole chain, so
+# it only holds processors the codebase needs: log calls pass keyword fields
+# (no %-style positional args) and never request stack_info
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=_log_serializer),
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -62,7 +79,29 @@ logger = structlog.get_logger(__name__)
 
 
 class CostTracker:
-    """Track API costs and enforce limits."""
+    """Track API costs and enforce limits.
+
+    Cost rows are buffered in memory and written in one transaction once
+    enough have accumulated, a cost query runs, or the process exits, keeping
+    SQLite commits off the generation path. In the web app
+    ``flush_costs_periodically`` also writes rows older than
+    ``FLUSH_INTERVAL_SECONDS`` in the background.
+    """
+
+    FLUSH_SIZE = 20
+    FLUSH_INTERVAL_SECONDS = 5.0
+    # Re-read the day's total from SQLite this often, to pick up costs
+    # written by other processes (e.g. ingestion scripts)
+    ROLLUP_REFRESH_SECONDS = 60.0
+
+    # Shared by every tracker on the same database: db path -> pending rows
+    _pending: Dict[str, List[tuple]] = {}
+    # db path -> monotonic time the oldest pending row was buffered
+    _oldest_pending: Dict[str, float] = {}
+    _pending_lock = threading.Lock()
+    # db path -> (day start, day end, total cost, loaded at) for the last day
+    # queried; record_cost adds to it so reads skip the SUM scan
+    _daily_totals: Dict[str, tuple] = {}
 
     def __init__(self, daily_limit: float = 10.0):
         self.daily_limit = daily_limit
@@ -74,8 +113,7 @@ class CostTracker:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
+            conn.execute("""
                 CREATE TABLE IF NOT EXISTS api_costs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -85,8 +123,7 @@ class CostTracker:
                     tokens_used INTEGER,
                     metadata TEXT
                 )
-            """
-            )
+            """)
             conn.commit()
 
     def record_cost(
@@ -96,23 +133,34 @@ class CostTracker:
         cost_usd: float,
         tokens_used: Optional[int] = None,
         metadata: Optional[dict] = None,
+        flush: bool = False,
     ):
-        """Record an API cost."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                INSERT INTO api_costs (service, operation, cost_usd, tokens_used, metadata)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (
-                    service,
-                    operation,
-                    cost_usd,
-                    tokens_used,
-                    json.dumps(metadata) if metadata else None,
-                ),
-            )
-            conn.commit()
+        """Record an API cost (buffered unless ``flush`` is set)."""
+        # Same format as SQLite's CURRENT_TIMESTAMP, taken now rather than
+        # when the buffered row is eventually written
+        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        row = (
+            timestamp,
+            service,
+            operation,
+            cost_usd,
+            tokens_used,
+            json.dumps(metadata) if metadata else None,
+        )
+
+        key = str(self.db_path)
+        with self._pending_lock:
+            pending = self._pending.setdefault(key, [])
+            pending.append(row)
+            self._oldest_pending.setdefault(key, time.monotonic())
+            rollup = self._daily_totals.get(key)
+            if rollup and rollup[0] <= timestamp < rollup[1]:
+                self._daily_totals[key] = (*rollup[:2], rollup[2] + cost_usd, rollup[3])
+            # Age-based flushing is left to the background task, so the caller
+            # never pays for a write just because the buffer sat idle
+            due = flush or len(pending) >= self.FLUSH_SIZE
+        if due:
+            self.flush()
 
         logger.info(
             "API cost recorded",
@@ -122,13 +170,35 @@ class CostTracker:
             tokens_used=tokens_used,
         )
 
+    def flush(self):
+        """Write buffered cost rows for this tracker's database."""
+        _flush_costs(str(self.db_path))
+
     def get_daily_cost(self, date: Optional[datetime] = None) -> float:
-        """Get total cost for a specific day."""
+        """Get total cost for a specific day.
+
+        The total is kept as a running sum that ``record_cost`` updates, and
+        is only re-read from the database when the day changes or it is
+        older than ``ROLLUP_REFRESH_SECONDS``.
+        """
         if date is None:
             date = datetime.now()
 
         start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = start_of_day + timedelta(days=1)
+        # Same text form sqlite3 binds datetimes as, so bounds compare alike
+        bounds = (str(start_of_day), str(end_of_day))
+
+        key = str(self.db_path)
+        rollup = self._daily_totals.get(key)
+        if (
+            rollup
+            and rollup[:2] == bounds
+            and time.monotonic() - rollup[3] < self.ROLLUP_REFRESH_SECONDS
+        ):
+            return rollup[2]
+
+        self.flush()
 
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
@@ -137,9 +207,19 @@ class CostTracker:
                 FROM api_costs 
                 WHERE timestamp >= ? AND timestamp < ?
             """,
-                (start_of_day, end_of_day),
+                bounds,
             )
-            return cursor.fetchone()[0]
+            total = cursor.fetchone()[0]
+
+        with self._pending_lock:
+            # Rows recorded since the flush are not in the database yet
+            total += sum(
+                row[3]
+                for row in self._pending.get(key, ())
+                if bounds[0] <= row[0] < bounds[1]
+            )
+            self._daily_totals[key] = (*bounds, total, time.monotonic())
+        return total
 
     def check_daily_limit(self) -> bool:
         """Check if daily cost limit has been exceeded."""
@@ -150,6 +230,7 @@ class CostTracker:
         """Get cost breakdown by service for the last N days."""
         cutoff_date = datetime.now() - timedelta(days=days)
 
+        self.flush()
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
                 """
@@ -163,6 +244,73 @@ class CostTracker:
             return dict(cursor.fetchall())
 
 
+def _flush_costs(db_path: str):
+    """Write the pending cost rows for one database in a single transaction."""
+    with CostTracker._pending_lock:
+        rows = CostTracker._pending.pop(db_path, None)
+        oldest = CostTracker._oldest_pending.pop(db_path, None)
+    if not rows:
+        return
+
+    try:
+        with sqlite3.connect(db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO api_costs
+                    (timestamp, service, operation, cost_usd, tokens_used, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+            conn.commit()
+    except sqlite3.Error:
+        # Keep the rows for the next attempt rather than losing spend records
+        with CostTracker._pending_lock:
+            CostTracker._pending[db_path] = rows + CostTracker._pending.get(db_path, [])
+            CostTracker._oldest_pending[db_path] = oldest
+        raise
+
+
+@atexit.register
+def _flush_all_costs():
+    """Write every buffered cost row before the process exits."""
+    for db_path in list(CostTracker._pending):
+        try:
+            _flush_costs(db_path)
+        except sqlite3.Error as e:
+            logger.error("Failed to flush cost records", db_path=db_path, error=str(e))
+
+
+def _flush_stale_costs(max_age: float):
+    """Write the buffered rows of every database whose oldest row is ``max_age`` old."""
+    now = time.monotonic()
+    with CostTracker._pending_lock:
+        stale = [
+            db_path
+            for db_path, buffered_at in CostTracker._oldest_pending.items()
+            if now - buffered_at >= max_age
+        ]
+    for db_path in stale:
+        try:
+            _flush_costs(db_path)
+        except sqlite3.Error as e:
+            logger.error("Failed to flush cost records", db_path=db_path, error=str(e))
+
+
+async def flush_costs_periodically(
+    interval: float = CostTracker.FLUSH_INTERVAL_SECONDS,
+):
+    """Write buffered cost rows once they are ``interval`` seconds old.
+
+    Runs until cancelled. Checks twice per interval, so no row waits much
+    longer than one and a half intervals.
+    """
+    while True:
+        await asyncio.sleep(interval / 2)
+        if CostTracker._oldest_pending:
+            await asyncio.to_thread(_flush_stale_costs, interval)
+
+
 class ActivityLogger:
     """Log bot activities and posting history."""
 
@@ -370,55 +518,23 @@ class ActivityLogger:
         """Get posting success rate for the last N hours, optionally filtered by account."""
         cutoff_time = datetime.now() - timedelta(hours=hours)
 
-        with sqlite3.connect(self.db_path) as conn:
-            if account_filter:
-                # Total attempts for account
-                cursor = conn.execute(
-                    """
-                    SELECT COUNT(*) FROM post_history 
-                    WHERE timestamp >= ? AND account_id = ?
-                """,
-                    (cutoff_time, account_filter),
-                )
-                total = cursor.fetchone()[0]
-
-                if total == 0:
-                    return 1.0
-
-                # Successful posts for account
-                cursor = conn.execute(
-                    """
-                    SELECT COUNT(*) FROM post_history 
-                    WHERE timestamp >= ? AND account_id = ? AND status = 'success'
-                """,
-                    (cutoff_time, account_filter),
-                )
-                successful = cursor.fetchone()[0]
-            else:
-                # Total attempts
-                cursor = conn.execute(
-                    """
-                    SELECT COUNT(*) FROM post_history 
-                    WHERE timestamp >= ?
-                """,
-                    (cutoff_time,),
-                )
-                total = cursor.fetchone()[0]
-
-                if total == 0:
-                    return 1.0
+        # Total and successful attempts in one pass over the window
+        query = """
+            SELECT COUNT(*), COALESCE(SUM(status = 'success'), 0)
+            FROM post_history
+            WHERE timestamp >= ?
+        """
+        params = [cutoff_time]
+        if account_filter:
+            query += " AND account_id = ?"
+            params.append(account_filter)
 
-                # Successful posts
-                cursor = conn.execute(
-                    """
-                    SELECT COUNT(*) FROM post_history 
-                    WHERE timestamp >= ? AND status = 'success'
-                """,
-                    (cutoff_time,),
-                )
-                successful = cursor.fetchone()[0]
+        with sqlite3.connect(self.db_path) as conn:
+            total, successful = conn.execute(query, params).fetchone()
 
-            return successful / total
+        if total == 0:
+            return 1.0
+        return successful / total
 
     def get_last_successful_post_time(
         self, account_id: Optional[str] = None
@@ -571,6 +687,10 @@ class HealthChecker:
         """Check API key availability (not validity)."""
         import os
 
+        from app.account_manager import ensure_env_loaded
+
+        ensure_env_loaded()
+
         required_keys = [
             "OPENAI_API_KEY",
             "TWITTER_BEARER_TOKEN",
@@ -277,9 +277,9 @@ class TweetScheduler:
             logger.info("Starting scheduled multi-account tweet generation and posting")
 
             # Check if emergency stop is active
-            from app.main import emergency_stop
+            from app.main import emergency_stop_event
 
-            if emergency_stop:
+            if emergency_stop_event.is_set():
                 logger.warning("Scheduled post skipped due to emergency stop")
                 self.activity_logger.log_system_event(
                     "scheduled_post_skipped",
@@ -585,9 +585,9 @@ class TweetScheduler:
             logger.info("Executing catch-up post", account_id=account_id)
 
             # Check if emergency stop is active
-            from app.main import emergency_stop
+            from app.main import emergency_stop_event
 
-            if emergency_stop:
+            if emergency_stop_event.is_set():
                 logger.warning(
                     "Catch-up post skipped due to emergency stop", account_id=account_id
                 )
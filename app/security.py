@@ -43,6 +43,67 @@ from app.monitoring import ActivityLogger, CostTracker
 
 logger = structlog.get_logger(__name__)
 
+# Basic profanity list (can be expanded)
+_PROFANITY_WORDS = frozenset(
+    {
+        "damn",
+        "hell",
+        "shit",
+        "fuck",
+        "bitch",
+        "ass",
+        "piss",
+        "crap",
+        "bastard",
+        "slut",
+        "whore",
+        "dick",
+        "cock",
+        "pussy",
+        "cunt",
+    }
+)
+
+# Inappropriate content patterns
+_INAPPROPRIATE_PATTERNS = (
+    r"\b(kill|murder|suicide|die|death)\b",  # Violence/death
+    r"\b(hate|hatred|despise)\s+(people|person|group|race|religion)\b",  # Hate speech
+    r"\b(buy|purchase|sale|discount|offer|deal)\b.*\b(now|today|limited)\b",  # Spam/promotion
+    r"\b(click|visit|check\s+out)\s+(link|website|url)\b",  # Spam links
+    r"\b(drugs|cocaine|heroin|meth|marijuana)\b",  # Drug references
+)
+
+# Political/controversial topics to avoid
+_POLITICAL_KEYWORDS = frozenset(
+    {
+        "trump",
+        "biden",
+        "republican",
+        "democrat",
+        "liberal",
+        "conservative",
+        "election",
+        "vote",
+        "politics",
+        "political",
+        "government",
+        "congress",
+        "president",
+        "senator",
+        "politician",
+    }
+)
+
+# Compiled once per process so each check is a single scan of the text.
+# Profanity keeps substring semantics (any occurrence, not whole words); the
+# patterns become one alternation whose group name identifies the match.
+_PROFANITY_RE = re.compile("|".join(map(re.escape, sorted(_PROFANITY_WORDS))))
+_INAPPROPRIATE_RE = re.compile(
+    "|".join(
+        f"(?P<p{i}>{pattern})" for i, pattern in enumerate(_INAPPROPRIATE_PATTERNS)
+    )
+)
+
 
 class ContentFilter:
     """Filter content for safety and appropriateness."""
@@ -54,6 +115,7 @@ class ContentFilter:
 
         # Load configuration
         config = get_config()
+        self._config = config
         content_filter_config = config.get("content_filter", {})
         self.enabled = content_filter_config.get("enabled", True)
         self.use_openai_moderation = content_filter_config.get(
@@ -61,52 +123,10 @@ class ContentFilter:
         )
         self.use_profanity_filter = content_filter_config.get("profanity_filter", True)
 
-        # Basic profanity list (can be expanded)
-        self.profanity_words = {
-            "damn",
-            "hell",
-            "shit",
-            "fuck",
-            "bitch",
-            "ass",
-            "piss",
-            "crap",
-            "bastard",
-            "slut",
-            "whore",
-            "dick",
-            "cock",
-            "pussy",
-            "cunt",
-        }
-
-        # Inappropriate content patterns
-        self.inappropriate_patterns = [
-            r"\b(kill|murder|suicide|die|death)\b",  # Violence/death
-            r"\b(hate|hatred|despise)\s+(people|person|group|race|religion)\b",  # Hate speech
-            r"\b(buy|purchase|sale|discount|offer|deal)\b.*\b(now|today|limited)\b",  # Spam/promotion
-            r"\b(click|visit|check\s+out)\s+(link|website|url)\b",  # Spam links
-            r"\b(drugs|cocaine|heroin|meth|marijuana)\b",  # Drug references
-        ]
-
-        # Political/controversial topics to avoid
-        self.political_keywords = {
-            "trump",
-            "biden",
-            "republican",
-            "democrat",
-            "liberal",
-            "conservative",
-            "election",
-            "vote",
-            "politics",
-            "political",
-            "government",
-            "congress",
-            "president",
-            "senator",
-            "politician",
-        }
+        # Word lists and patterns are shared module constants (see above)
+        self.profanity_words = _PROFANITY_WORDS
+        self.inappropriate_patterns = _INAPPROPRIATE_PATTERNS
+        self.political_keywords = _POLITICAL_KEYWORDS
 
     def is_content_safe(self, text: str) -> bool:
         """Main content safety check."""
@@ -132,28 +152,34 @@ class ContentFilter:
             # Fail safe: if filtering fails, reject content
             return False
 
+    def is_locally_safe(self, text: str) -> bool:
+        """Rule-based checks only, without the moderation API call."""
+        return not self.enabled or self._basic_safety_check(text)
+
     def _basic_safety_check(self, text: str) -> bool:
         """Basic rule-based safety checks."""
         text_lower = text.lower()
 
         # Check for profanity
         if self.use_profanity_filter:
-            for word in self.profanity_words:
-                if word in text_lower:
-                    logger.warning("Content rejected for profanity", word=word)
-                    self._log_filter_event("profanity", text, f"Contains word: {word}")
-                    return False
+            match = _PROFANITY_RE.search(text_lower)
+            if match:
+                word = match.group()
+                logger.warning("Content rejected for profanity", word=word)
+                self._log_filter_event("profanity", text, f"Contains word: {word}")
+                return False
 
         # Check inappropriate patterns
-        for pattern in self.inappropriate_patterns:
-            if re.search(pattern, text_lower):
-                logger.warning(
-                    "Content rejected for inappropriate pattern", pattern=pattern
-                )
-                self._log_filter_event(
-                    "inappropriate_pattern", text, f"Matches pattern: {pattern}"
-                )
-                return False
+        match = _INAPPROPRIATE_RE.search(text_lower)
+        if match:
+            pattern = _INAPPROPRIATE_PATTERNS[int(match.lastgroup[1:])]
+            logger.warning(
+                "Content rejected for inappropriate pattern", pattern=pattern
+            )
+            self._log_filter_event(
+                "inappropriate_pattern", text, f"Matches pattern: {pattern}"
+            )
+            return False
 
         # Check for political content
         political_words_found = [
@@ -348,11 +374,31 @@ class EmergencyControls:
         return warnings
 
 
+# Shared filter, rebuilt when the config or OpenAI client changes
+_content_filter: Optional[ContentFilter] = None
+
+
+def get_content_filter() -> ContentFilter:
+    """Return a reusable ContentFilter.
+
+    Building one opens the cost and activity databases, so request handlers
+    share a single instance instead of constructing one per validation.
+    """
+    global _content_filter
+    if (
+        _content_filter is None
+        or _content_filter._config is not get_config()
+        or _content_filter.openai_client is not get_openai_client()
+    ):
+        _content_filter = ContentFilter()
+    return _content_filter
+
+
 # Convenience functions
 def filter_tweet_content(text: str) -> bool:
     """Quick content filtering for tweets."""
     try:
-        content_filter = ContentFilter()
+        content_filter = get_content_filter()
         return content_filter.is_content_safe(text)
     except Exception as e:
         logger.error("Content filtering failed", error=str(e))
@@ -362,7 +408,7 @@ def filter_tweet_content(text: str) -> bool:
 def validate_user_input(text: str, input_type: str = "general") -> bool:
     """Validate user input from the web interface."""
     try:
-        content_filter = ContentFilter()
+        content_filter = get_content_filter()
 
         if input_type == "persona":
             return content_filter.validate_persona_content(text)
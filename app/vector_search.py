@@ -29,6 +29,7 @@ philosophical sources while maintaining thematic coherence through
 semantic similarity matching.
 """
 
+import logging
 import random
 from typing import Dict, List, Optional, Tuple
 
@@ -41,6 +42,12 @@ from app.exceptions import OpenAIError, VectorDBError
 from app.monitoring import ActivityLogger
 
 logger = structlog.get_logger(__name__)
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Return whether debug records from this module would be emitted."""
+    return _stdlib_logger.isEnabledFor(logging.DEBUG)
 
 
 class VectorSearcher:
@@ -184,12 +191,13 @@ class VectorSearcher:
                 # Check similarity threshold
                 similarity = 1 - distance  # Convert distance to similarity
                 if similarity < self.similarity_threshold:
-                    logger.debug(
-                        "Chunk below similarity threshold",
-                        chunk_id=chunk_id,
-                        similarity=similarity,
-                        threshold=self.similarity_threshold,
-                    )
+                    if _debug_enabled():
+                        logger.debug(
+                            "Chunk below similarity threshold",
+                            chunk_id=chunk_id,
+                            similarity=similarity,
+                            threshold=self.similarity_threshold,
+                        )
                     continue
 
                 chunk = {
@@ -0,0 +1,367 @@
+"""Unit tests for account management functionality."""
+
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from app.account_manager import (
+    AccountManager,
+    _parse_and_validate,
+    get_account_manager,
+    reset_account_manager,
+    resolve_env_variables,
+)
+from app.exceptions import ConfigurationError
+
+
+def make_account(account_id="test_account", **overrides):
+    """Build a minimal valid account configuration."""
+    account = {
+        "account_id": account_id,
+        "display_name": "Test Account",
+        "persona": "A calm and thoughtful voice.",
+        "exemplars": [{"id": 1, "text": "Be here now."}],
+        "vector_collection": "test_collection",
+        "twitter_credentials": {
+            "api_key": "key",
+            "api_secret": "secret",
+            "access_token": "token",
+            "access_token_secret": "token_secret",
+            "bearer_token": "bearer",
+        },
+    }
+    account.update(overrides)
+    return account
+
+
+def write_account(accounts_dir, account):
+    """Write an account configuration file and return its path."""
+    path = accounts_dir / f"{account['account_id']}.json"
+    path.write_text(json.dumps(account))
+    return path
+
+
+class TestAccountCache:
+    """Test account cache invalidation."""
+
+    @pytest.fixture
+    def accounts_dir(self, tmp_path):
+        """Create a temporary accounts directory with one account."""
+        accounts_dir = tmp_path / "accounts"
+        accounts_dir.mkdir()
+        write_account(accounts_dir, make_account())
+        return accounts_dir
+
+    @pytest.fixture
+    def no_client_invalidation(self, monkeypatch):
+        """Keep saves from touching the shared API client caches."""
+        monkeypatch.setattr(AccountManager, "_invalidate_clients", lambda *args: None)
+
+    def test_load_all_accounts(self, accounts_dir):
+        """Test loading accounts from the directory."""
+        manager = AccountManager(accounts_dir=str(accounts_dir), watch=False)
+
+        accounts = manager.load_all_accounts()
+
+        assert list(accounts) == ["test_account"]
+        assert accounts["test_account"]["display_name"] == "Test Account"
+
+    def test_cache_not_rescanned_within_interval(self, accounts_dir):
+        """Test that edits are not picked up until the check interval elapses."""
+        manager = AccountManager(
+            accounts_dir=str(accounts_dir), mtime_check_interval=60, watch=False
+        )
+        manager.load_all_accounts()
+
+        path = write_account(accounts_dir, make_account(display_name="Renamed"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        accounts = manager.load_all_accounts()
+        assert accounts["test_account"]["display_name"] == "Test Account"
+
+    def test_cache_reloads_on_modification(self, accounts_dir):
+        """Test that modified account files trigger a reload."""
+        manager = AccountManager(
+            accounts_dir=str(accounts_dir), mtime_check_interval=0, watch=False
+        )
+        manager.load_all_accounts()
+
+        path = write_account(accounts_dir, make_account(display_name="Renamed"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        accounts = manager.load_all_accounts()
+        assert accounts["test_account"]["display_name"] == "Renamed"
+
+    def test_cache_reloads_on_new_account(self, accounts_dir):
+        """Test that adding an account file triggers a reload."""
+        manager = AccountManager(
+            accounts_dir=str(accounts_dir), mtime_check_interval=0, watch=False
+        )
+        manager.load_all_accounts()
+
+        write_account(accounts_dir, make_account(account_id="second_account"))
+        stat = accounts_dir.stat()
+        os.utime(accounts_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        accounts = manager.load_all_accounts()
+        assert sorted(accounts) == ["second_account", "test_account"]
+
+    def test_reload_reuses_unchanged_accounts(self, accounts_dir):
+        """Test that only modified files are parsed again on reload."""
+        write_account(accounts_dir, make_account(account_id="second_account"))
+        manager = AccountManager(
+            accounts_dir=str(accounts_dir), mtime_check_interval=0, watch=False
+        )
+        second = manager.load_all_accounts()["second_account"]
+
+        path = write_account(accounts_dir, make_account(display_name="Renamed"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        accounts = manager.load_all_accounts()
+        assert accounts["test_account"]["display_name"] == "Renamed"
+        assert accounts["second_account"] is second
+
+    def test_watcher_marks_cache_dirty(self, accounts_dir):
+        """Test that the directory watcher invalidates the cache on change."""
+        pytest.importorskip("watchdog")
+
+        with AccountManager(accounts_dir=str(accounts_dir)) as manager:
+            manager.load_all_accounts()
+            assert manager._should_reload_cache() is False
+
+            write_account(accounts_dir, make_account(display_name="Renamed"))
+
+            deadline = time.monotonic() + 5
+            while not manager._should_reload_cache() and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+            accounts = manager.load_all_accounts()
+            assert accounts["test_account"]["display_name"] == "Renamed"
+
+    def test_save_updates_only_saved_account(
+        self, accounts_dir, no_client_invalidation
+    ):
+        """Test that saving keeps the other cached accounts."""
+        write_account(accounts_dir, make_account(account_id="second_account"))
+        manager = AccountManager(
+            accounts_dir=str(accounts_dir), mtime_check_interval=0, watch=False
+        )
+        manager.load_all_accounts()
+        second = manager._accounts_cache["second_account"]
+
+        assert manager.save_account(make_account(display_name="Renamed"))
+
+        accounts = manager.load_all_accounts()
+        assert accounts["test_account"]["display_name"] == "Renamed"
+        assert accounts["second_account"] is second
+        assert not list(accounts_dir.glob("*.tmp"))
+
+    def test_save_skips_unchanged_file(self, accounts_dir, no_client_invalidation):
+        """Test that saving identical contents does not rewrite the file."""
+        manager = AccountManager(accounts_dir=str(accounts_dir), watch=False)
+        manager.save_account(make_account(display_name="Renamed"))
+        path = accounts_dir / "test_account.json"
+        mtime = path.stat().st_mtime_ns
+        os.utime(path, ns=(mtime - 10**9, mtime - 10**9))
+
+        assert manager.save_account(make_account(display_name="Renamed"))
+        assert path.stat().st_mtime_ns == mtime - 10**9
+
+    def test_watcher_ignores_own_save(self, accounts_dir, no_client_invalidation):
+        """Test that reads and our own writes do not invalidate the cache."""
+        pytest.importorskip("watchdog")
+
+        with AccountManager(accounts_dir=str(accounts_dir)) as manager:
+            manager.load_all_accounts()
+            manager.save_account(make_account(display_name="Renamed"))
+            time.sleep(0.5)
+
+            assert manager._should_reload_cache() is False
+            assert manager.get_account("test_account")["display_name"] == "Renamed"
+
+
+class TestGetAccount:
+    """Test account lookup and environment variable resolution."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        """Create a manager with an account that references env variables."""
+        monkeypatch.setenv("TEST_BEARER_TOKEN", "bearer-from-env")
+        accounts_dir = tmp_path / "accounts"
+        accounts_dir.mkdir()
+        account = make_account()
+        account["twitter_credentials"]["bearer_token"] = "env:TEST_BEARER_TOKEN"
+        write_account(accounts_dir, account)
+        return AccountManager(accounts_dir=str(accounts_dir), watch=False)
+
+    def test_resolves_env_variables(self, manager):
+        """Test that env: references are resolved."""
+        account = manager.get_account("test_account")
+
+        assert account["twitter_credentials"]["bearer_token"] == "bearer-from-env"
+
+    def test_resolved_once_per_load(self, manager, monkeypatch):
+        """Test that lookups reuse the resolution made at load time."""
+        account = manager.get_account("test_account")
+        monkeypatch.setenv("TEST_BEARER_TOKEN", "rotated")
+
+        assert manager.get_account("test_account") is account
+
+    def test_reload_env_picks_up_changes(self, manager, monkeypatch):
+        """Test that reload_env re-resolves a changed environment variable."""
+        manager.get_account("test_account")
+        monkeypatch.setenv("TEST_BEARER_TOKEN", "rotated")
+
+        manager.reload_env()
+
+        account = manager.get_account("test_account")
+        assert account["twitter_credentials"]["bearer_token"] == "rotated"
+
+    def test_missing_env_variable(self, manager, monkeypatch):
+        """Test that an unresolvable account is reported as missing."""
+        monkeypatch.delenv("TEST_BEARER_TOKEN")
+
+        assert manager.get_account("test_account") is None
+
+    def test_raw_config_is_not_mutated(self, manager):
+        """Test that resolution copies the containers it patches."""
+        manager.get_account("test_account")
+
+        raw = manager.load_all_accounts()["test_account"]
+        assert raw["twitter_credentials"]["bearer_token"] == "env:TEST_BEARER_TOKEN"
+
+    def test_missing_account(self, manager):
+        """Test that unknown accounts return None."""
+        assert manager.get_account("unknown") is None
+
+    def test_loads_only_requested_file(self, manager):
+        """Test that a lookup does not parse the other account files."""
+        (manager.accounts_dir / "broken.json").write_text("{not json")
+
+        assert manager.get_account("test_account") is not None
+        assert list(manager._accounts_cache) == ["test_account"]
+
+    def test_account_ids_from_file_names(self, manager):
+        """Test that account IDs are listed without parsing the files."""
+        write_account(manager.accounts_dir, make_account("second_account"))
+
+        assert sorted(manager.get_account_ids()) == ["second_account", "test_account"]
+        assert manager._accounts_cache == {}
+
+
+class TestGlobalAccountManager:
+    """Test the process-wide account manager singleton."""
+
+    @pytest.fixture(autouse=True)
+    def isolated(self, tmp_path, monkeypatch):
+        """Point the default accounts directory at an empty temp dir."""
+        monkeypatch.chdir(tmp_path)
+        reset_account_manager()
+        yield
+        reset_account_manager()
+
+    def test_concurrent_access_builds_one_instance(self):
+        """Test that racing threads share a single manager."""
+        managers = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            managers.append(get_account_manager())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(manager) for manager in managers}) == 1
+
+    def test_reset_creates_new_instance(self):
+        """Test that reset_account_manager discards the cached instance."""
+        first = get_account_manager()
+        reset_account_manager()
+
+        assert get_account_manager() is not first
+
+
+class TestValidateAccountConfig:
+    """Test account configuration validation."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create a manager over an empty accounts directory."""
+        return AccountManager(accounts_dir=str(tmp_path), watch=False)
+
+    def test_valid_config(self, manager):
+        """Test that a complete configuration passes."""
+        assert manager.validate_account_config(make_account()) is True
+
+    def test_reports_all_missing_fields(self, manager):
+        """Test that every missing field is listed in one error."""
+        account = make_account()
+        del account["persona"]
+        del account["exemplars"]
+
+        with pytest.raises(ConfigurationError, match="persona, exemplars"):
+            manager.validate_account_config(account)
+
+    @pytest.mark.parametrize("account_id", ["bad id", "bad.id", "bad/id"])
+    def test_rejects_invalid_account_id(self, manager, account_id):
+        """Test that account IDs are limited to letters, digits, _ and -."""
+        with pytest.raises(ConfigurationError, match="account_id"):
+            manager.validate_account_config(make_account(account_id))
+
+    def test_parse_collects_env_paths(self):
+        """Test that parsing also records every env: reference."""
+        account = make_account(exemplars=[{"id": 1, "text": "env:EXEMPLAR_TEXT"}])
+        account["twitter_credentials"]["api_key"] = "env:API_KEY"
+
+        config, env_paths = _parse_and_validate(json.dumps(account).encode())
+
+        assert config == account
+        assert sorted(env_paths) == [
+            (("exemplars", 0, "text"), "EXEMPLAR_TEXT"),
+            (("twitter_credentials", "api_key"), "API_KEY"),
+        ]
+
+
+class TestResolveEnvVariables:
+    """Test standalone env: resolution."""
+
+    def test_resolves_nested_values(self, monkeypatch):
+        """Test that env: strings inside dicts and lists are replaced."""
+        monkeypatch.setenv("TEST_SECRET", "s3cret")
+        config = {
+            "creds": {"token": "env:TEST_SECRET"},
+            "tags": ["a", "env:TEST_SECRET"],
+        }
+
+        resolved = resolve_env_variables(config)
+
+        assert resolved == {"creds": {"token": "s3cret"}, "tags": ["a", "s3cret"]}
+        assert config["creds"]["token"] == "env:TEST_SECRET"
+
+    def test_shares_untouched_containers(self, monkeypatch):
+        """Test that containers without env references are not copied."""
+        monkeypatch.setenv("TEST_SECRET", "s3cret")
+        config = {"token": "env:TEST_SECRET", "exemplars": [{"text": "hi"}]}
+
+        assert resolve_env_variables(config)["exemplars"] is config["exemplars"]
+
+    def test_top_level_values(self, monkeypatch):
+        """Test plain strings, lists and missing variables."""
+        monkeypatch.setenv("TEST_SECRET", "s3cret")
+        monkeypatch.delenv("TEST_MISSING", raising=False)
+
+        assert resolve_env_variables("env:TEST_SECRET") == "s3cret"
+        assert resolve_env_variables(["env:TEST_SECRET", 1]) == ["s3cret", 1]
+        assert resolve_env_variables("plain") == "plain"
+        with pytest.raises(ConfigurationError, match="TEST_MISSING"):
+            resolve_env_variables({"token": "env:TEST_MISSING"})
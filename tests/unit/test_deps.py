@@ -0,0 +1,151 @@
+"""Unit tests for dependency loading helpers."""
+
+import os
+
+import pytest
+
+from app import deps
+from app.exceptions import ConfigurationError
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """Run from an empty project directory with a fresh file cache."""
+    (tmp_path / "config").mkdir()
+    (tmp_path / "data").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(deps, "_file_cache", {})
+    return tmp_path
+
+
+def bump_mtime(path):
+    """Move a file's mtime forward so the change is always detected."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestFileBackedSettings:
+    """Test mtime-memoized config, persona and exemplar loading."""
+
+    def test_config_is_memoized(self, project_dir):
+        """Test that an unchanged config file is parsed once."""
+        (project_dir / "config" / "config.yaml").write_text("openai:\n  model: a\n")
+
+        assert deps.get_config() is deps.get_config()
+
+    def test_config_reloads_on_change(self, project_dir):
+        """Test that editing the config file is picked up."""
+        config_path = project_dir / "config" / "config.yaml"
+        config_path.write_text("openai:\n  model: a\n")
+        deps.get_config()
+
+        config_path.write_text("openai:\n  model: b\n")
+        bump_mtime(config_path)
+
+        assert deps.get_config()["openai"]["model"] == "b"
+
+    def test_missing_config(self, project_dir):
+        """Test that a missing config raises ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            deps.get_config()
+
+    def test_persona_and_exemplars_fallback_files(self, project_dir):
+        """Test the single-account persona and exemplar files."""
+        (project_dir / "data" / "persona.txt").write_text("  A calm voice.\n")
+        (project_dir / "data" / "exemplars.json").write_text('[{"text": "Hi"}]')
+
+        assert deps.get_persona() == "A calm voice."
+        assert deps.get_exemplars() == [{"text": "Hi"}]
+
+    def test_warm_settings_cache(self, project_dir, monkeypatch):
+        """Test that warming parses config and fallback files up front."""
+        (project_dir / "config" / "config.yaml").write_text("openai:\n  model: a\n")
+        (project_dir / "data" / "persona.txt").write_text("A calm voice.")
+        monkeypatch.setattr(deps, "load_all_accounts", lambda: {})
+
+        deps.warm_settings_cache()
+
+        assert len(deps._file_cache) == 2
+
+    def test_json_file_round_trip(self, project_dir):
+        """Test that written JSON files read back unchanged and compact."""
+        path = project_dir / "data" / "exemplars.json"
+        exemplars = [{"id": 1, "text": "Caf\u00e9 thoughts"}]
+
+        deps.write_json_file(path, exemplars)
+
+        assert deps.read_json_file(path) == exemplars
+        assert path.read_text(encoding="utf-8").startswith('[{"id":1')
+        assert list(path.parent.iterdir()) == [path]
+
+
+class TestAsyncOpenAIClient:
+    """Test the shared asyncio OpenAI client."""
+
+    def test_client_is_shared_with_bounded_pool(self, monkeypatch):
+        """Test that one tuned client is reused for the same API key."""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        deps._build_async_openai_client.cache_clear()
+
+        client = deps.get_async_openai_client()
+
+        assert deps.get_async_openai_client() is client
+        assert client.timeout.connect == 5.0
+        assert client.max_retries == 3
+        deps._build_async_openai_client.cache_clear()
+
+
+class TestTwitterClient:
+    """Test the environment-credential Twitter client."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_clients(self, monkeypatch):
+        """Start each test with an empty client cache and no credentials."""
+        monkeypatch.setattr(deps, "_twitter_clients", {})
+        for key in deps._TWITTER_ENV_KEYS:
+            monkeypatch.delenv(key, raising=False)
+
+    def test_reports_missing_env_credentials(self, monkeypatch):
+        """Test that every missing variable is named in the error."""
+        monkeypatch.setenv("TWITTER_BEARER_TOKEN", "bearer")
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            deps.get_twitter_client()
+
+        message = str(exc_info.value)
+        assert "TWITTER_BEARER_TOKEN" not in message
+        assert "TWITTER_API_KEY" in message
+        assert "TWITTER_ACCESS_TOKEN_SECRET" in message
+
+    def test_client_reused_until_credentials_change(self, monkeypatch):
+        """Test that the client is cached per credential set."""
+        pytest.importorskip("tweepy")
+        for key in deps._TWITTER_ENV_KEYS:
+            monkeypatch.setenv(key, key.lower())
+
+        client = deps.get_twitter_client()
+        assert deps.get_twitter_client() is client
+
+        monkeypatch.setenv("TWITTER_API_KEY", "rotated")
+        assert deps.get_twitter_client() is not client
+
+
+class TestVectorDb:
+    """Test the shared ChromaDB client lifecycle."""
+
+    def test_shutdown_releases_client(self, project_dir):
+        """Test that shutdown drops the client so the next call reopens it."""
+        pytest.importorskip("chromadb")
+        (project_dir / "config" / "config.yaml").write_text(
+            f"vector_db:\n  persist_directory: {project_dir / 'chroma'}\n"
+        )
+
+        client = deps.get_vector_db()
+        assert deps.get_vector_db() is client
+
+        deps.shutdown_vector_db()
+        assert deps._vector_db is None
+
+        reopened = deps.get_vector_db()
+        deps.shutdown_vector_db()
+        assert reopened is not client
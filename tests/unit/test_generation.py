@@ -0,0 +1,436 @@
+"""Unit tests for tweet generation helpers."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app import generation
+from app.exceptions import GenerationError
+from app.generation import (
+    _clean_llm_output,
+    _get_prompt_env,
+    _get_prompt_template,
+    _pricing_for,
+    _truncate_at_sentence,
+)
+
+
+class TestPromptTemplates:
+    """Test shared prompt template loading."""
+
+    def test_templates_are_compiled_once(self):
+        """Test that repeated lookups return the same compiled template."""
+        assert _get_prompt_template("context_suffix.j2") is _get_prompt_template(
+            "context_suffix.j2"
+        )
+        assert _get_prompt_env().auto_reload is False
+
+    def test_prompt_puts_static_prefix_first(self, monkeypatch):
+        """Test that persona and exemplars precede the per-call context."""
+        monkeypatch.setattr(generation, "get_config", lambda: {})
+        monkeypatch.setattr(generation, "get_async_openai_client", lambda: None)
+        monkeypatch.setattr(generation, "ActivityLogger", lambda: None)
+        tweet_generator = generation.TweetGenerator(account_id="zenkink")
+        exemplars = [{"text": "Be here."}]
+
+        prompt = tweet_generator.build_generation_prompt(
+            [{"text": "Presence is now.", "metadata": {}}], exemplars, "A calm voice."
+        )
+        prefix = tweet_generator._prompt_prefix[2]
+
+        assert prompt.startswith(prefix)
+        assert prefix.startswith("A calm voice.")
+        assert '"Be here."' in prefix
+        assert "Presence is now." in prompt[len(prefix) :]
+
+        tweet_generator.build_generation_prompt([], exemplars, "A calm voice.")
+        assert tweet_generator._prompt_prefix[2] is prefix
+
+        exemplars.append({"text": "Breathe."})
+        prompt = tweet_generator.build_generation_prompt([], exemplars, "A calm voice.")
+        assert '"Breathe."' in prompt
+
+
+class TestTruncateAtSentence:
+    """Test deterministic sentence-boundary trimming."""
+
+    def test_keeps_whole_sentences_within_limit(self):
+        """Test that trailing sentences are dropped and line breaks kept."""
+        text = "Be here now.\nFeel the breath! " + "x" * 50
+
+        assert _truncate_at_sentence(text, 40) == "Be here now.\nFeel the breath!"
+
+    def test_rejects_cut_that_loses_too_much(self):
+        """Test that a boundary keeping under half the limit is refused."""
+        text = "Yes. " + "a very long second sentence " * 5
+
+        assert _truncate_at_sentence(text, 60) is None
+
+
+class TestCleanLlmOutput:
+    """Test normalisation of raw model output."""
+
+    def test_wrapping_quotes_are_removed(self):
+        """Test that one pair of matching outer quotes is stripped."""
+        assert _clean_llm_output(' "Be here now."\n') == "Be here now."
+        assert _clean_llm_output("'Be here now.'") == "Be here now."
+        assert _clean_llm_output("\u201cBe here now.\u201d") == "Be here now."
+
+    def test_unmatched_and_embedded_quotes_are_kept(self):
+        """Test that quotes which do not wrap the whole text survive."""
+        assert _clean_llm_output('He said "be here"') == 'He said "be here"'
+        assert _clean_llm_output("\"Be here now.'") == "\"Be here now.'"
+
+
+class TestPricing:
+    """Test model pricing lookup."""
+
+    @pytest.mark.parametrize(
+        "model, rates",
+        [
+            ("o3", (0.06, 0.24)),
+            ("o4-mini", (0.0015, 0.006)),
+            ("gpt-4.1", (0.0025, 0.01)),
+            ("gpt-4.1-mini", (0.0004, 0.0016)),
+            ("gpt-4o-mini", (0.00015, 0.0006)),
+            ("gpt-4o", (0.03, 0.06)),
+            ("gpt-3.5-turbo", (0.0015, 0.002)),
+            ("some-other-model", (0.0015, 0.002)),
+        ],
+    )
+    def test_rates_by_model(self, model, rates):
+        """Test that model names map to their per-1K-token rates."""
+        assert _pricing_for(model) == rates
+
+
+class TestGetGenerator:
+    """Test reuse of TweetGenerator instances."""
+
+    @pytest.fixture(autouse=True)
+    def fake_dependencies(self, monkeypatch):
+        """Provide stable config and client objects without real services."""
+        self.config = {"openai": {"model": "gpt-4.1"}}
+        self.client = object()
+        monkeypatch.setattr(generation, "_generators", {})
+        monkeypatch.setattr(generation, "get_config", lambda: self.config)
+        monkeypatch.setattr(generation, "get_async_openai_client", lambda: self.client)
+        monkeypatch.setattr(generation, "ActivityLogger", lambda: None)
+
+    def test_generator_reused_per_account(self):
+        """Test that the same account gets the same generator."""
+        generator = generation.get_generator("zenkink")
+
+        assert generation.get_generator("zenkink") is generator
+        assert generation.get_generator("other") is not generator
+
+    def test_generator_rebuilt_on_config_change(self):
+        """Test that a reloaded config produces a fresh generator."""
+        generator = generation.get_generator("zenkink")
+        self.config = {"openai": {"model": "o3"}}
+
+        rebuilt = generation.get_generator("zenkink")
+
+        assert rebuilt is not generator
+        assert rebuilt.model == "o3"
+
+    def test_model_override_gets_own_generator(self):
+        """Test that a fallback-model generator does not replace the default."""
+        generator = generation.get_generator("zenkink")
+
+        fallback = generation.get_generator("zenkink", model="o3")
+
+        assert fallback is not generator
+        assert fallback.model == "o3"
+        assert generation.get_generator("zenkink") is generator
+
+
+class FakeCompletions:
+    """Async stand-in for ``client.chat.completions`` returning canned text."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(message=SimpleNamespace(content=self.replies.pop(0)))
+            ],
+            usage=SimpleNamespace(
+                prompt_tokens=100, completion_tokens=20, total_tokens=120
+            ),
+        )
+
+
+class FakeResponses:
+    """Async stand-in for ``client.responses`` returning canned text."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(
+            output_text=self.replies.pop(0),
+            usage=SimpleNamespace(
+                input_tokens=100,
+                output_tokens=60,
+                total_tokens=160,
+                output_tokens_details=SimpleNamespace(reasoning_tokens=40),
+            ),
+        )
+
+
+class TestGenerateTweet:
+    """Test the async generation pipeline with a fake OpenAI client."""
+
+    @pytest.fixture
+    def generator(self, monkeypatch):
+        """Build a generator whose external calls are all canned."""
+        seed = {
+            "id": "chunk-1",
+            "text": "Presence.",
+            "metadata": {"source_title": "Book"},
+        }
+        monkeypatch.setattr(
+            generation, "get_config", lambda: {"openai": {"model": "gpt-4.1"}}
+        )
+        monkeypatch.setattr(generation, "ActivityLogger", lambda: None)
+        monkeypatch.setattr(
+            generation, "get_random_seed", lambda account_id=None: (seed, "hash-1")
+        )
+        monkeypatch.setattr(
+            generation,
+            "get_generation_context",
+            lambda seed_chunk, account_id=None: [seed_chunk],
+        )
+        monkeypatch.setattr(
+            generation,
+            "get_content_filter",
+            lambda: SimpleNamespace(is_locally_safe=lambda text: True),
+        )
+        monkeypatch.setattr(generation, "get_persona", lambda account_id=None: "Calm.")
+        monkeypatch.setattr(
+            generation, "get_exemplars", lambda account_id=None: [{"text": "Be."}]
+        )
+
+        def build(replies):
+            completions = FakeCompletions(replies)
+            client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+            monkeypatch.setattr(generation, "get_async_openai_client", lambda: client)
+            return generation.TweetGenerator(account_id="zenkink"), completions
+
+        return build
+
+    @pytest.mark.asyncio
+    async def test_generates_tweet(self, generator):
+        """Test that a short reply is returned without quotes or shortening."""
+        tweet_generator, completions = generator(['"Be here now."'])
+
+        result = await tweet_generator.generate_tweet(test_mode=True)
+
+        assert result.tweet_text == "Be here now."
+        assert result.seed_chunk_id == "chunk-1"
+        assert result.was_shortened is False
+        assert len(completions.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_generation(self, generator, monkeypatch):
+        """Test that bulk generation returns one result per account."""
+        tweet_generator, _ = generator(["First.", "Second."])
+        monkeypatch.setattr(
+            generation, "get_generator", lambda account_id: tweet_generator
+        )
+
+        results = await generation.generate_tweets_bulk(["a", "b"], test_mode=True)
+
+        assert sorted(r.tweet_text for r in results) == ["First.", "Second."]
+
+    @pytest.mark.asyncio
+    async def test_long_tweet_trimmed_without_second_call(self, generator):
+        """Test that an over-long reply is cut at a sentence, not re-generated."""
+        long_reply = "Be here now. " * 25
+        tweet_generator, completions = generator([long_reply])
+
+        result = await tweet_generator.generate_tweet(test_mode=True)
+
+        assert len(result.tweet_text) <= tweet_generator.target_length
+        assert result.tweet_text.endswith("now.")
+        assert result.was_shortened is True
+        assert len(completions.calls) == 1
+        assert completions.calls[0]["max_tokens"] == tweet_generator.output_token_limit
+        assert tweet_generator.shortening_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_unbreakable_long_tweet_uses_shortener(self, generator):
+        """Test that the LLM shortener is the fallback and is counted."""
+        long_reply = "word " * 80
+        tweet_generator, completions = generator([long_reply, "Be here now."])
+
+        result = await tweet_generator.generate_tweet(test_mode=True)
+
+        assert result.tweet_text == "Be here now."
+        assert tweet_generator.shortening_calls == 1
+        assert len(completions.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_test_tweet_uses_custom_persona(self, generator, monkeypatch):
+        """Test that a persona override applies to one call on the shared generator."""
+        shared_generator, completions = generator(["Be here now.", "Be."])
+        monkeypatch.setattr(
+            generation, "get_generator", lambda account_id: shared_generator
+        )
+
+        result = await generation.generate_test_tweet(
+            custom_persona="A stern voice.", account_id="zenkink"
+        )
+
+        assert result["status"] == "success"
+        prompt = completions.calls[0]["messages"][1]["content"]
+        assert prompt.startswith("A stern voice.")
+
+        await shared_generator.generate_tweet(test_mode=True)
+        assert completions.calls[1]["messages"][1]["content"].startswith("Calm.")
+
+    def test_pick_candidate_prefers_safe_fitting_text(self, generator, monkeypatch):
+        """Test that an unsafe or over-long candidate is passed over."""
+        tweet_generator, _ = generator([])
+        monkeypatch.setattr(
+            generation,
+            "get_content_filter",
+            lambda: SimpleNamespace(is_locally_safe=lambda text: "hell" not in text),
+        )
+        too_long = "Be here now. " * 25
+
+        picked = tweet_generator._pick_candidate(
+            ["What the hell.", too_long, "Be here now."]
+        )
+
+        assert picked == "Be here now."
+        assert tweet_generator._pick_candidate(["hell", "hell no"]) == "hell"
+
+    def test_reasoning_output_limit_tracks_usage(self, generator):
+        """Test that the o3 output cap follows observed usage within bounds."""
+        tweet_generator, _ = generator([])
+        assert tweet_generator.reasoning_output_limit == 300
+
+        for _ in range(99):
+            tweet_generator._record_output_tokens(140)
+        assert tweet_generator.reasoning_output_limit == 300
+
+        tweet_generator._record_output_tokens(140)
+        assert tweet_generator.reasoning_output_limit == 168
+
+        for _ in range(100):
+            tweet_generator._record_output_tokens(50)
+        assert tweet_generator.reasoning_output_limit == 168
+
+    @pytest.mark.asyncio
+    async def test_reasoning_candidates_use_concurrent_calls(self, monkeypatch):
+        """Test that o3 candidates come from separate calls and are screened."""
+        config = {"openai": {"model": "o3", "reasoning_candidates": 2}}
+        responses = FakeResponses(["Word " * 80, "Be here now."])
+        client = SimpleNamespace(responses=responses)
+        monkeypatch.setattr(generation, "get_config", lambda: config)
+        monkeypatch.setattr(generation, "get_async_openai_client", lambda: client)
+        monkeypatch.setattr(generation, "ActivityLogger", lambda: None)
+        tweet_generator = generation.TweetGenerator(account_id="zenkink")
+        monkeypatch.setattr(
+            generation,
+            "get_content_filter",
+            lambda: SimpleNamespace(is_locally_safe=lambda text: True),
+        )
+
+        tweet = await tweet_generator.call_openai_for_generation("Prompt")
+
+        assert tweet == "Be here now."
+        assert len(responses.calls) == 2
+        assert len(tweet_generator._output_token_samples) == 2
+
+    @pytest.mark.asyncio
+    async def test_generation_batch_round_trip(self, generator):
+        """Test that a submitted batch comes back as tweets tied to their seeds."""
+        tweet_generator, _ = generator([])
+        uploads = []
+
+        async def create_file(file, purpose):
+            uploads.append(file[1].decode())
+            return SimpleNamespace(id="file-in")
+
+        async def create_batch(**kwargs):
+            return SimpleNamespace(id="batch-1", **kwargs)
+
+        async def retrieve_batch(batch_id):
+            return SimpleNamespace(
+                status="completed", output_file_id="file-out", error_file_id=None
+            )
+
+        async def file_content(file_id):
+            request = json.loads(uploads[0])
+            body = {"choices": [{"message": {"content": '"Be here now."'}}]}
+            line = {
+                "custom_id": request["custom_id"],
+                "response": {"status_code": 200, "body": body},
+                "error": None,
+            }
+            return SimpleNamespace(text=json.dumps(line))
+
+        tweet_generator.openai_client = SimpleNamespace(
+            files=SimpleNamespace(create=create_file, content=file_content),
+            batches=SimpleNamespace(create=create_batch, retrieve=retrieve_batch),
+        )
+
+        # The canned seed search always returns the same chunk
+        batch_id = await tweet_generator.submit_generation_batch(2)
+        results = await tweet_generator.fetch_generation_batch(batch_id)
+
+        assert len(uploads[0].splitlines()) == 1
+        assert json.loads(uploads[0])["url"] == "/v1/chat/completions"
+        assert results == [
+            {
+                "tweet_text": "Be here now.",
+                "seed_chunk_hash": "hash-1",
+                "seed_chunk_id": "chunk-1",
+                "character_count": 12,
+                "was_shortened": False,
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_generation_batch_all_failed(self, generator):
+        """Test that a batch with only failed requests returns no tweets."""
+        tweet_generator, _ = generator([])
+        read = []
+
+        async def retrieve_batch(batch_id):
+            return SimpleNamespace(
+                status="completed", output_file_id=None, error_file_id="file-err"
+            )
+
+        async def file_content(file_id):
+            read.append(file_id)
+            line = {
+                "custom_id": "0|hash-1|chunk-1",
+                "response": {"status_code": 500, "body": {}},
+                "error": None,
+            }
+            return SimpleNamespace(text=json.dumps(line))
+
+        tweet_generator.openai_client = SimpleNamespace(
+            files=SimpleNamespace(content=file_content),
+            batches=SimpleNamespace(retrieve=retrieve_batch),
+        )
+
+        assert await tweet_generator.fetch_generation_batch("batch-1") == []
+        assert read == ["file-err"]
+
+    @pytest.mark.asyncio
+    async def test_empty_generation_batch_rejected(self, generator):
+        """Test that a batch must ask for at least one tweet."""
+        tweet_generator, _ = generator([])
+
+        with pytest.raises(GenerationError):
+            await tweet_generator.submit_generation_batch(0)
@@ -1,13 +1,21 @@
 """Unit tests for monitoring functionality."""
 
+import asyncio
 import pytest
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
 import tempfile
 import os
+import json
 
-from app.monitoring import CostTracker, ActivityLogger, HealthChecker
+from app.monitoring import (
+    CostTracker,
+    ActivityLogger,
+    HealthChecker,
+    _log_serializer,
+    flush_costs_periodically,
+)
 
 
 class TestCostTracker:
@@ -33,6 +41,9 @@ class TestCostTracker:
             tracker = CostTracker(daily_limit=5.0)
             
             yield tracker
+
+            # Write buffered rows while the temporary database still exists
+            tracker.flush()
             
             # Restore original init
             CostTracker.__init__ = original_init
@@ -66,6 +77,68 @@ class TestCostTracker:
         assert breakdown["openai"] == 2.50
         assert breakdown["twitter"] == 0.01
 
+    def test_costs_are_buffered_until_flush(self, temp_cost_tracker):
+        """Test that cost rows are written in batches, not per call."""
+        temp_cost_tracker.record_cost("openai", "completion", 1.0)
+
+        with sqlite3.connect(temp_cost_tracker.db_path) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM api_costs").fetchone()[0]
+        assert rows == 0
+
+        temp_cost_tracker.flush()
+        with sqlite3.connect(temp_cost_tracker.db_path) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM api_costs").fetchone()[0]
+        assert rows == 1
+
+    def test_idle_gap_does_not_flush_on_record(self, temp_cost_tracker, monkeypatch):
+        """Test that recording after a quiet period still only buffers."""
+        monkeypatch.setattr(CostTracker, "FLUSH_INTERVAL_SECONDS", 0.0)
+        temp_cost_tracker.record_cost("openai", "completion", 1.0)
+        temp_cost_tracker.record_cost("openai", "completion", 1.0)
+
+        with sqlite3.connect(temp_cost_tracker.db_path) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM api_costs").fetchone()[0]
+        assert rows == 0
+
+    @pytest.mark.asyncio
+    async def test_buffered_costs_flushed_on_timer(self, temp_cost_tracker):
+        """Test that a lone buffered row is written without another cost."""
+        temp_cost_tracker.record_cost("openai", "completion", 1.0)
+        task = asyncio.create_task(flush_costs_periodically(interval=0.01))
+        try:
+            await asyncio.sleep(0.1)
+        finally:
+            task.cancel()
+
+        with sqlite3.connect(temp_cost_tracker.db_path) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM api_costs").fetchone()[0]
+        assert rows == 1
+
+    def test_daily_cost_is_kept_as_running_total(self, temp_cost_tracker):
+        """Test that new costs update the daily total without a re-query."""
+        temp_cost_tracker.record_cost("openai", "completion", 1.0)
+        assert temp_cost_tracker.get_daily_cost() == 1.0
+
+        temp_cost_tracker.record_cost("openai", "completion", 2.0)
+
+        assert temp_cost_tracker.get_daily_cost() == 3.0
+        with sqlite3.connect(temp_cost_tracker.db_path) as conn:
+            rows = conn.execute("SELECT COUNT(*) FROM api_costs").fetchone()[0]
+        assert rows == 1
+
+    def test_daily_cost_refreshes_from_database(self, temp_cost_tracker, monkeypatch):
+        """Test that costs written elsewhere are picked up on refresh."""
+        monkeypatch.setattr(CostTracker, "ROLLUP_REFRESH_SECONDS", 0.0)
+        assert temp_cost_tracker.get_daily_cost() == 0
+
+        with sqlite3.connect(temp_cost_tracker.db_path) as conn:
+            conn.execute(
+                "INSERT INTO api_costs (service, operation, cost_usd) "
+                "VALUES ('openai', 'embedding', 0.5)"
+            )
+
+        assert temp_cost_tracker.get_daily_cost() == 0.5
+
 
 class TestActivityLogger:
     """Test ActivityLogger functionality."""
@@ -190,4 +263,17 @@ class TestHealthChecker:
         
         assert health_status["status"] == "unhealthy"
         assert "failed_checks" in health_status
-        assert "config" in health_status["failed_checks"]
\ No newline at end of file
+        assert "config" in health_status["failed_checks"]
+
+
+class TestLogSerializer:
+    """Test the JSON serializer used by the structlog renderer."""
+
+    def test_renders_valid_json_text(self):
+        """Test that events serialize to str JSON, including odd values."""
+        rendered = _log_serializer(
+            {"event": "done", "counts": {1: 2}, "path": Path("a")}, default=repr
+        )
+
+        assert isinstance(rendered, str)
+        assert json.loads(rendered)["counts"] == {"1": 2}
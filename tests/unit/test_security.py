@@ -0,0 +1,66 @@
+"""Unit tests for content filtering rules."""
+
+import pytest
+
+from app import security
+from app.security import _INAPPROPRIATE_RE, _PROFANITY_RE
+
+
+class TestCompiledFilters:
+    """Test the precompiled profanity and pattern matchers."""
+
+    @pytest.mark.parametrize(
+        "text, index",
+        [
+            ("they kill the mood", 0),
+            ("i hate people", 1),
+            ("buy this now", 2),
+            ("click link below", 3),
+            ("no drugs here", 4),
+        ],
+    )
+    def test_match_reports_original_pattern(self, text, index):
+        """Test that a match identifies which pattern caught the text."""
+        match = _INAPPROPRIATE_RE.search(text)
+
+        assert match.lastgroup == f"p{index}"
+
+    def test_clean_text_passes(self):
+        """Test that ordinary text matches neither filter."""
+        text = "breathe in, let the moment land"
+
+        assert _INAPPROPRIATE_RE.search(text) is None
+        assert _PROFANITY_RE.search(text) is None
+
+    def test_profanity_matches_substrings(self):
+        """Test that profanity keeps its any-occurrence matching."""
+        assert _PROFANITY_RE.search("what the hell").group() == "hell"
+
+
+class TestSharedContentFilter:
+    """Test reuse of the ContentFilter across validations."""
+
+    @pytest.fixture
+    def stub_deps(self, monkeypatch):
+        """Provide swappable config and client objects."""
+        deps = {"config": {"content_filter": {}}, "client": object()}
+        monkeypatch.setattr(security, "_content_filter", None)
+        monkeypatch.setattr(security, "get_config", lambda: deps["config"])
+        monkeypatch.setattr(security, "get_openai_client", lambda: deps["client"])
+        monkeypatch.setattr(security, "CostTracker", lambda: None)
+        monkeypatch.setattr(security, "ActivityLogger", lambda: None)
+        return deps
+
+    def test_filter_is_reused(self, stub_deps):
+        """Test that repeated calls share one filter."""
+        assert security.get_content_filter() is security.get_content_filter()
+
+    def test_filter_is_rebuilt_on_config_change(self, stub_deps):
+        """Test that a reloaded config produces a fresh filter."""
+        first = security.get_content_filter()
+        stub_deps["config"] = {"content_filter": {"enabled": False}}
+
+        second = security.get_content_filter()
+
+        assert second is not first
+        assert second.enabled is False